@@ -64,6 +64,8 @@ def main() -> int:
         controller.stop()
         # 停止实时预览
         controller.stop_live_debug()
+        # 释放检测模型
+        controller.detector.close()
         # 隐藏窗口
         window.hide()
         # 清理托盘图标
@@ -80,7 +82,10 @@ def main() -> int:
         QTimer.singleShot(100, QApplication.quit)
 
     app.aboutToQuit.connect(cleanup_resources)
-    return app.exec_()
+    exit_code = app.exec_()
+    # 事件循环结束后再关闭数据库连接
+    storage.close()
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -36,10 +36,11 @@ class AppSettings:
     # - "gpu": allow GPU acceleration when available
     compute_device: str = "cpu"
     # MediaPipe Pose model complexity:
-    # - 0: Lite (fast, lower Z-axis accuracy)
-    # - 1: Full (balanced, better Z-axis accuracy) - recommended for non-realtime detection
+    # - 0: Lite (fast, lower Z-axis accuracy) - default; ~3x fewer MACs than Full and
+    #   accurate enough for the seated head-forward / trunk-angle thresholds
+    # - 1: Full (balanced, better Z-axis accuracy)
     # - 2: Heavy (slow, best Z-axis accuracy)
-    pose_model_complexity: int = 1
+    pose_model_complexity: int = 0
     # Camera angle mode affects detection strategy:
     # - "upper_body": only shoulders and above visible, disable hunchback detection
     # - "full_body": full body visible, enable all detection types
@@ -63,7 +63,7 @@ class SitAlarmController(QObject):
         self.detector = HeadRatioPostureDetector(
             ratio_threshold=self._effective_head_ratio_threshold(self.settings.head_ratio_threshold),
             compute_device=self._compute_device,
-            pose_model_complexity=getattr(self.settings, "pose_model_complexity", 1),
+            pose_model_complexity=getattr(self.settings, "pose_model_complexity", 0),
             camera_angle_mode=getattr(self.settings, "camera_angle_mode", "upper_body"),
         )
         self.reminder_policy = ReminderPolicy(self.settings.reminder_cooldown_minutes)
@@ -103,6 +103,7 @@ class SitAlarmController(QObject):
 
     def start(self) -> None:
         self._log.info("Controller start. settings=%s", self.settings)
+        self._system_usage.start_background()
         self._system_usage.tick()
         self.apply_settings(self.settings)
         self._publish_stats()
@@ -116,6 +117,9 @@ class SitAlarmController(QObject):
         self._log.info("Controller stop.")
         self._timer.stop()
         self.stop_live_debug()
+        self._system_usage.stop_background()
+        # 写入缓冲中的统计增量
+        self.storage.flush()
         self.state_changed.emit("已停止")
         # 触发垃圾回收，释放 numpy 数组内存
         try:
@@ -128,6 +132,7 @@ class SitAlarmController(QObject):
         self._log.info("Pause detection.")
         self._paused = True
         self._timer.stop()
+        self.storage.flush()
         self.state_changed.emit("已暂停")
 
     def resume_detection(self) -> None:
@@ -185,7 +190,7 @@ class SitAlarmController(QObject):
         previous_compute_device = getattr(self, "_compute_device", "cpu")
         requested_compute_device = getattr(settings, "compute_device", "cpu")
         self._compute_device = effective_compute_device(requested_compute_device)
-        # Enable/disable OpenCV OpenCL. This makes the UMat path actually use GPU when available.
+        # Enable/disable OpenCV OpenCL for any transparent-API (UMat) work on the GPU path.
         try:
             import cv2  # type: ignore
 
@@ -194,6 +199,7 @@ class SitAlarmController(QObject):
         except Exception:
             pass
 
+        previous_detector = self.detector
         self.detector = HeadRatioPostureDetector(
             ratio_threshold=self.detector.ratio_threshold,
             pose_visibility_threshold=self.detector.pose_visibility_threshold,
@@ -202,9 +208,10 @@ class SitAlarmController(QObject):
             hunchback_threshold_degrees=self.detector.hunchback_threshold_degrees,
             ear_span_too_close_threshold=self.detector.ear_span_too_close_threshold,
             compute_device=self._compute_device,
-            pose_model_complexity=getattr(settings, "pose_model_complexity", 1),
+            pose_model_complexity=getattr(settings, "pose_model_complexity", 0),
             camera_angle_mode=getattr(settings, "camera_angle_mode", "upper_body"),
         )
+        previous_detector.close()
 
         base = self._effective_head_ratio_threshold(settings.head_ratio_threshold)
         multiplier = self._threshold_multiplier(settings.detection_mode)
@@ -353,7 +360,7 @@ class SitAlarmController(QObject):
             self._emit_calibration_status(phase="error", message=str(exc))
             return
 
-        ratio_result = self.detector.evaluate_frame(frame)
+        ratio_result = self.detector.evaluate_frame(frame, fresh=True)
         if ratio_result.head_ratio is None:
             self.error_occurred.emit("未识别到头部，请调整光线或角度后重试。")
             self._emit_calibration_status(
@@ -366,8 +373,8 @@ class SitAlarmController(QObject):
         self._calibration_ratios.append(ratio_result.head_ratio)
         self._calibration_image_paths.append(str(image_path))
 
-        head_forward_ratio = ratio_result.pose_debug.get("head_forward_ratio")
-        if head_forward_ratio is not None and isinstance(head_forward_ratio, (int, float)):
+        head_forward_ratio = ratio_result.head_forward_ratio
+        if head_forward_ratio is not None:
             self._calibration_head_forward_ratios.append(float(head_forward_ratio))
             self._log.info(
                 "Calibration sample %d: head_ratio=%.4f, head_forward_ratio=%.4f",
@@ -421,7 +428,7 @@ class SitAlarmController(QObject):
             self._emit_calibration_status(phase="error", message=str(exc))
             return
 
-        ratio_result = self.detector.evaluate_frame(frame)
+        ratio_result = self.detector.evaluate_frame(frame, fresh=True)
         if ratio_result.head_ratio is None:
             self.error_occurred.emit("未识别到头部，请调整光线或角度后重试。")
             self._emit_calibration_status(
@@ -433,8 +440,8 @@ class SitAlarmController(QObject):
         self._calibration_incorrect_ratios.append(ratio_result.head_ratio)
         self._calibration_incorrect_image_paths.append(str(image_path))
 
-        head_forward_ratio = ratio_result.pose_debug.get("head_forward_ratio")
-        if head_forward_ratio is not None and isinstance(head_forward_ratio, (int, float)):
+        head_forward_ratio = ratio_result.head_forward_ratio
+        if head_forward_ratio is not None:
             self._calibration_incorrect_head_forward_ratios.append(float(head_forward_ratio))
             self._log.info(
                 "Incorrect calibration sample %d: head_ratio=%.4f, head_forward_ratio=%.4f",
@@ -587,7 +594,8 @@ class SitAlarmController(QObject):
             self.stats_service.record_screen_usage(usage_day, usage_delta)
 
         frame, brightness_info = self._prepare_frame_for_detection(raw_frame)
-        result = self._detect_posture(frame, brightness_info=brightness_info)
+        # 实时预览帧间隔很短，可复用上一帧的人脸框
+        result = self._detect_posture(frame, brightness_info=brightness_info, fresh=False)
 
         debug_info = result.debug_info or {}
         preview_frame = self._live_preview_service.draw_pose_overlay(
@@ -617,8 +625,13 @@ class SitAlarmController(QObject):
     def _prepare_frame_for_detection(self, frame: object) -> tuple[object, dict[str, object]]:
         return self.capture_service.normalize_frame_brightness(frame)
 
-    def _detect_posture(self, frame: object, brightness_info: dict[str, object] | None = None) -> PostureResult:
-        ratio_result = self.detector.evaluate_frame(frame)
+    def _detect_posture(
+        self,
+        frame: object,
+        brightness_info: dict[str, object] | None = None,
+        fresh: bool = True,
+    ) -> PostureResult:
+        ratio_result = self.detector.evaluate_frame(frame, fresh=fresh)
 
         debug_info = {
             "head_ratio": round(ratio_result.head_ratio, 4) if ratio_result.head_ratio is not None else None,
@@ -626,8 +639,11 @@ class SitAlarmController(QObject):
             "face_box": ratio_result.face_box,
             "pose_status": ratio_result.pose_status,
             "distance_status": ratio_result.distance_status,
-            "pose_landmarks": list(ratio_result.pose_landmarks),
-            "pose_connections": list(ratio_result.pose_connections),
+            "pose_landmarks": ratio_result.pose_landmarks,
+            # Same tuple every frame; the preview caches its skeleton by identity.
+            "pose_connections": ratio_result.pose_connections,
+            "head_forward_ratio": ratio_result.head_forward_ratio,
+            "threshold_head_forward": ratio_result.head_forward_threshold,
             "calibrated": self._is_calibrated(),
             **ratio_result.pose_debug,
             **(brightness_info or {}),
@@ -11,6 +11,18 @@ class CaptureError(RuntimeError):
     pass
 
 
+def configure_low_latency(camera: Any, backend: Any) -> None:
+    """Best-effort: keep only the newest frame in the driver queue and prefer MJPEG.
+
+    V4L2/DirectShow buffer several frames by default, so read() can return a frame that
+    is seconds old after any pause. Backends that reject either property are left as is.
+    """
+    with contextlib.suppress(Exception):
+        camera.set(backend.CAP_PROP_BUFFERSIZE, 1)
+    with contextlib.suppress(Exception):
+        camera.set(backend.CAP_PROP_FOURCC, backend.VideoWriter_fourcc(*"MJPG"))
+
+
 class CameraCaptureService:
     def __init__(
         self,
@@ -39,6 +51,7 @@ class CameraCaptureService:
                 last_error = "无法打开摄像头，请检查权限或占用情况。"
                 continue
 
+            configure_low_latency(camera, backend)
             frame = self._read_warmed_frame(camera)
             camera.release()
 
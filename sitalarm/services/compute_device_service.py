@@ -78,6 +78,8 @@ def _has_windows_gpu() -> bool:
             text=True,
             timeout=3,
             check=False,
+            # No console window flash when started from the GUI process.
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
         )
     except Exception:
         return False
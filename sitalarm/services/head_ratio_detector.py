@@ -1,13 +1,26 @@
 ﻿from __future__ import annotations
 
 import math
+import os
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Protocol, Tuple
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, Protocol, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # numpy ships with opencv-python; keep pure-Python fallbacks regardless.
+    np = None
 
 from sitalarm.services.compute_device_service import effective_compute_device
 from sitalarm.services.mediapipe_model_service import (
     ensure_face_detector_model,
     ensure_pose_landmarker_model,
+    find_face_detector_onnx_model,
 )
 
 FaceBox = Tuple[int, int, int, int]
@@ -21,10 +34,136 @@ DEFAULT_HIP_VISIBILITY_THRESHOLD = 0.25
 DEFAULT_HEAD_FORWARD_THRESHOLD = 0.28
 DEFAULT_HUNCHBACK_THRESHOLD_DEGREES = 14.0
 DEFAULT_EAR_SPAN_TOO_CLOSE_THRESHOLD = 0.19
+# MediaPipe pose landmark indices; stable across the Solutions and Tasks APIs.
+_NOSE = 0
+_LEFT_EAR = 7
+_RIGHT_EAR = 8
+_LEFT_SHOULDER = 11
+_RIGHT_SHOULDER = 12
+_LEFT_HIP = 23
+_RIGHT_HIP = 24
+_HEAD_LANDMARK_IDS = (_NOSE, _LEFT_EAR, _RIGHT_EAR)
+_KEY_LANDMARK_IDS = (_NOSE, _LEFT_EAR, _RIGHT_EAR, _LEFT_SHOULDER, _RIGHT_SHOULDER, _LEFT_HIP, _RIGHT_HIP)
+# Minimum visibility for a head/ear landmark to be used in a measurement.
+_LANDMARK_VISIBILITY = 0.35
+# Frames are downscaled once to this width and the same RGB image feeds both
+# face detection and pose inference.
+INFER_MAX_WIDTH = 512
+# Once this many consecutive frames had no face and pose found nobody either, pose
+# inference is skipped until a face shows up again (the user has usually walked away).
+POSE_SKIP_AFTER_FACELESS_FRAMES = 3
+# A cached face box is only reused for frames this close to the detection that produced
+# it (back-to-back live preview frames), never across detection intervals.
+FACE_BOX_REUSE_MAX_AGE_SECONDS = 0.5
+
+
+def _trunk_angle_from_delta(dx: float, dy: float) -> float:
+    """Angle between the hip->shoulder vector and vertical, in degrees; -1.0 if degenerate."""
+    # Same degenerate cut-off as norm <= 1e-6, without the sqrt.
+    if dx * dx + dy * dy <= 1e-12:
+        return -1.0
+    # atan2(|dx|, -dy) equals acos(-dy / norm) on [0, 180] with no clamp or normalization.
+    return math.degrees(math.atan2(abs(dx), -dy))
+
+
+def _ema_step(previous: float, current: float, alpha: float) -> float:
+    return alpha * current + (1.0 - alpha) * previous
+
+
+def _dist3(ax: float, ay: float, az: float, bx: float, by: float, bz: float) -> float:
+    return math.sqrt((ax - bx) ** 2 + (ay - by) ** 2 + (az - bz) ** 2)
+
+
+# Optional: numba compiles the scalar kernels above when it is installed.
+try:
+    from numba import njit  # type: ignore
+except ImportError:
+    pass
+else:
+    try:
+        _trunk_angle_from_delta = njit(cache=True, fastmath=True)(_trunk_angle_from_delta)
+        _ema_step = njit(cache=True, fastmath=True)(_ema_step)
+        _dist3 = njit(cache=True, fastmath=True)(_dist3)
+    except Exception:
+        # A broken numba install must not take the detector down; keep the Python versions.
+        pass
+
+
+def _close_resources(*resources: Any) -> None:
+    """Finalizer target: close MediaPipe graphs / shut down executors, ignoring errors.
+
+    Kept at module level so weakref.finalize does not hold a reference to the owner.
+    """
+    for resource in resources:
+        if resource is None:
+            continue
+        try:
+            if isinstance(resource, ThreadPoolExecutor):
+                resource.shutdown(wait=False)
+            else:
+                resource.close()
+        except Exception:
+            pass
+
+
+def _clamp_boxes(
+    rows: list[tuple[float, float, float, float]],
+    scale_x: float,
+    scale_y: float,
+    frame_width: int,
+    frame_height: int,
+) -> list[FaceBox]:
+    """Scale (x, y, w, h) rows from inference pixels to the frame and clamp them to it.
+
+    Boxes that end up empty are dropped.
+    """
+    if not rows:
+        return []
+
+    if np is not None:
+        # One vectorized pass instead of ~10 int/min/max calls per detection.
+        boxes = (np.asarray(rows, dtype=np.float64) * (scale_x, scale_y, scale_x, scale_y)).astype(np.int64)
+        np.clip(boxes[:, 0], 0, frame_width - 1, out=boxes[:, 0])
+        np.clip(boxes[:, 1], 0, frame_height - 1, out=boxes[:, 1])
+        np.clip(boxes[:, 2], 0, frame_width - boxes[:, 0], out=boxes[:, 2])
+        np.clip(boxes[:, 3], 0, frame_height - boxes[:, 1], out=boxes[:, 3])
+        keep = (boxes[:, 2] > 0) & (boxes[:, 3] > 0)
+        return [tuple(row) for row in boxes[keep].tolist()]
+
+    result: list[FaceBox] = []
+    for raw_x, raw_y, raw_w, raw_h in rows:
+        x = max(0, min(int(raw_x * scale_x), frame_width - 1))
+        y = max(0, min(int(raw_y * scale_y), frame_height - 1))
+        w = max(0, min(int(raw_w * scale_x), frame_width - x))
+        h = max(0, min(int(raw_h * scale_y), frame_height - y))
+        if w > 0 and h > 0:
+            result.append((x, y, w, h))
+    return result
+
+
+def _next_timestamp_ms(previous: int) -> int:
+    """Timestamp for MediaPipe Tasks VIDEO mode, which rejects non-increasing values."""
+    return max(int(time.monotonic() * 1000), previous + 1)
 
 
 @dataclass(frozen=True)
 class HeadRatioResult:
+    # One result is produced per frame; slots keep it to a fixed-size object.
+    __slots__ = (
+        "status",
+        "reasons",
+        "head_ratio",
+        "face_box",
+        "threshold",
+        "pose_status",
+        "distance_status",
+        "pose_landmarks",
+        "pose_connections",
+        "head_forward_ratio",
+        "head_forward_threshold",
+        "pose_debug",
+    )
+
     status: str
     reasons: tuple[str, ...]
     head_ratio: float | None
@@ -34,7 +173,152 @@ class HeadRatioResult:
     distance_status: str
     pose_landmarks: tuple[PoseLandmarkPoint, ...]
     pose_connections: tuple[PoseConnection, ...]
-    pose_debug: dict[str, object]
+    head_forward_ratio: float | None
+    head_forward_threshold: float | None
+    pose_debug: Mapping[str, object]
+
+
+# Returned as pose_debug when the detector runs with debug=False.
+_EMPTY_DEBUG: Mapping[str, object] = MappingProxyType({})
+
+
+class _PoseSnapshot(NamedTuple):
+    """Scalars from the last pose evaluation; pose_debug is rebuilt from these on demand."""
+
+    pose_available: bool
+    pose_detected: bool
+    shoulder_visibility: float | None = None
+    hip_visibility: float | None = None
+    ear_span_ratio: float | None = None
+    upper_body_mode: bool | None = None
+    head_forward_ratio: float | None = None
+    trunk_angle: float | None = None
+    head_forward_threshold: float | None = None
+
+
+_POSE_UNAVAILABLE = _PoseSnapshot(pose_available=False, pose_detected=False)
+_POSE_NOT_DETECTED = _PoseSnapshot(pose_available=True, pose_detected=False)
+
+
+def _score_pose(
+    head_forward_raw: float | None,
+    trunk_angle_raw: float | None,
+    previous_head_forward: float | None,
+    previous_trunk_angle: float | None,
+    ema_alpha: float,
+    head_forward_threshold: float,
+    hunchback_threshold_degrees: float,
+    upper_body_mode: bool,
+) -> tuple[str, tuple[str, ...], float | None, float | None, float]:
+    """Smooth the raw pose measurements and classify them.
+
+    Works on plain floats only so the per-frame scoring stays a handful of scalar ops.
+    Returns (status, reasons, head_forward_ratio, trunk_angle, effective_head_forward_threshold);
+    head_forward_ratio is None when the pose was not visible enough to judge.
+    """
+    # Low-angle cameras exaggerate the perceived head-forward offset due to
+    # perspective distortion, so we RELAX the threshold to compensate.
+    effective_head_forward_threshold = head_forward_threshold * 1.15 if upper_body_mode else head_forward_threshold
+    if head_forward_raw is None:
+        return "unknown", (), None, None, effective_head_forward_threshold
+
+    if previous_head_forward is None:
+        head_forward = head_forward_raw
+    else:
+        head_forward = _ema_step(previous_head_forward, head_forward_raw, ema_alpha)
+
+    trunk_angle: float | None = None
+    if trunk_angle_raw is not None:
+        if previous_trunk_angle is None:
+            trunk_angle = trunk_angle_raw
+        else:
+            trunk_angle = _ema_step(previous_trunk_angle, trunk_angle_raw, ema_alpha)
+
+    head_forward_hit = head_forward >= effective_head_forward_threshold
+    hunchback_hit = trunk_angle is not None and trunk_angle >= hunchback_threshold_degrees
+    if head_forward_hit and hunchback_hit:
+        reasons: tuple[str, ...] = ("head_forward", "hunchback")
+    elif head_forward_hit:
+        reasons = ("head_forward",)
+    elif hunchback_hit:
+        reasons = ("hunchback",)
+    else:
+        reasons = ()
+    status = "incorrect" if reasons else "correct"
+    return status, reasons, head_forward, trunk_angle, effective_head_forward_threshold
+
+
+class _FramePreproc:
+    """One-slot cache of a frame's RGB conversion (and its downscaled copy).
+
+    Face detection and pose inference both need the frame in RGB; sharing this
+    object lets them convert each frame once. The cached frame is held by
+    reference, so a new frame can never alias the cached one by id or buffer address.
+
+    The RGB and downscaled buffers are reused across frames of the same size, so
+    results are only valid until the next frame is converted.
+    """
+
+    def __init__(self, cv2: Any) -> None:
+        self._cv2 = cv2
+        self._lock = threading.Lock()
+        self._frame: Any = None
+        self._rgb: Any = None
+        self._small: Any = None
+        self._small_valid = False
+        self._small_max_width = 0
+        self._mp_image: Any = None
+        self._mp_image_max_width = 0
+
+    def rgb(self, frame: Any) -> Any:
+        with self._lock:
+            return self._rgb_locked(frame)
+
+    def rgb_downscaled(self, frame: Any, max_width: int) -> Any:
+        """RGB frame resized to at most max_width pixels wide (the full RGB frame if narrower)."""
+        with self._lock:
+            rgb = self._rgb_locked(frame)
+            frame_height, frame_width = rgb.shape[:2]
+            if frame_width <= max_width:
+                return rgb
+            if not self._small_valid or self._small_max_width != max_width:
+                infer_height = max(1, int(frame_height * (max_width / frame_width)))
+                small = self._small
+                if small is not None and small.shape[:2] == (infer_height, max_width):
+                    self._cv2.resize(rgb, (max_width, infer_height), dst=small)
+                else:
+                    self._small = self._cv2.resize(rgb, (max_width, infer_height))
+                self._small_max_width = max_width
+                self._small_valid = True
+            return self._small
+
+    def mp_image(self, frame: Any, mp: Any, max_width: int) -> Any:
+        """mp.Image of rgb_downscaled(frame, max_width), built once per frame.
+
+        mp.Image copies pixel data on construction, so it cannot wrap a reused buffer;
+        caching it per frame lets the face and pose Tasks share one copy instead.
+        """
+        rgb = self.rgb_downscaled(frame, max_width)
+        with self._lock:
+            if self._mp_image is None or self._mp_image_max_width != max_width:
+                self._mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+                self._mp_image_max_width = max_width
+            return self._mp_image
+
+    def _rgb_locked(self, frame: Any) -> Any:
+        if frame is not self._frame:
+            cv2 = self._cv2
+            # Always on the CPU: an OpenCL UMat round-trip costs more in transfers than the
+            # SIMD conversion itself.
+            if self._rgb is not None and self._rgb.shape == frame.shape:
+                # Swap channels into the existing buffer instead of allocating a new frame.
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
+            else:
+                self._rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            self._small_valid = False
+            self._mp_image = None
+            self._frame = frame
+        return self._rgb
 
 
 class FaceDetector(Protocol):
@@ -48,6 +332,8 @@ class BlazeFaceFaceDetector:
     Behavior:
     - compute_device=cpu: use MediaPipe Solutions (no extra model downloads)
     - compute_device=gpu: try MediaPipe Tasks + GPU delegate; fall back to Solutions on failure
+    - backend=onnx (or SITALARM_FACE_BACKEND=onnx): run a local BlazeFace ONNX export with
+      ONNX Runtime; falls back to MediaPipe when onnxruntime or the model is missing
     """
 
     def __init__(
@@ -55,13 +341,43 @@ class BlazeFaceFaceDetector:
         model_selection: int = 1,
         min_detection_confidence: float = 0.5,
         compute_device: str = "cpu",
+        backend: str | None = None,
     ) -> None:
         self._compute_device = effective_compute_device(compute_device)
         self._mp = None
         self._tasks_detector = None
         self._solutions_detector = None
+        self._onnx_session = None
         self._backend = "unavailable"
         self._gpu_init_error: str | None = None
+        self._onnx_init_error: str | None = None
+        self._preproc: _FramePreproc | None = None
+        self._tasks_timestamp_ms = 0
+
+        self._init_backend(backend, model_selection, min_detection_confidence)
+        # Closes the graphs if the detector is dropped without close(); unlike __del__
+        # this keeps the instance out of the GC's finalizer special-casing.
+        self._finalizer = weakref.finalize(
+            self,
+            _close_resources,
+            self._solutions_detector,
+            self._tasks_detector,
+        )
+
+    def _init_backend(self, backend: str | None, model_selection: int, min_detection_confidence: float) -> None:
+        requested_backend = (backend or os.environ.get("SITALARM_FACE_BACKEND", "mediapipe")).strip().lower()
+        if requested_backend == "onnx":
+            model_path = find_face_detector_onnx_model()
+            if model_path is None:
+                self._onnx_init_error = "BlazeFace ONNX model not found"
+            else:
+                try:
+                    from sitalarm.services.onnx_face_detector import OnnxBlazeFaceSession
+
+                    self._onnx_session = OnnxBlazeFaceSession(model_path, min_detection_confidence)
+                    self._backend = "onnx:" + (self._onnx_session.providers[0] if self._onnx_session.providers else "cpu")
+                except RuntimeError as exc:
+                    self._onnx_init_error = str(exc)
 
         try:
             import mediapipe as mp  # type: ignore
@@ -70,17 +386,22 @@ class BlazeFaceFaceDetector:
         except ImportError:
             return
 
+        if self._onnx_session is not None:
+            return
+
         if self._compute_device == "gpu":
             try:
                 from mediapipe.tasks.python import BaseOptions  # type: ignore
                 from mediapipe.tasks.python.vision import FaceDetector, FaceDetectorOptions  # type: ignore
+                from mediapipe.tasks.python.vision.core.vision_task_running_mode import VisionTaskRunningMode  # type: ignore
 
                 model_path = ensure_face_detector_model()
                 options = FaceDetectorOptions(
                     base_options=BaseOptions(
                         model_asset_path=str(model_path),
                         delegate=BaseOptions.Delegate.GPU,
-                    )
+                    ),
+                    running_mode=VisionTaskRunningMode.VIDEO,
                 )
                 self._tasks_detector = FaceDetector.create_from_options(options)
                 self._backend = "tasks:gpu"
@@ -105,27 +426,30 @@ class BlazeFaceFaceDetector:
             "backend": self._backend,
             "compute_device": self._compute_device,
             "gpu_init_error": self._gpu_init_error,
+            "onnx_init_error": self._onnx_init_error,
         }
 
-    def __del__(self):
-        """Release MediaPipe resources when this instance is garbage-collected."""
-        try:
-            if hasattr(self, '_solutions_detector') and self._solutions_detector is not None:
-                self._solutions_detector.close()
-            if hasattr(self, '_tasks_detector') and self._tasks_detector is not None:
-                self._tasks_detector.close()
-        except Exception:
-            pass
-        finally:
-            if hasattr(self, '_solutions_detector'):
-                self._solutions_detector = None
-            if hasattr(self, '_tasks_detector'):
-                self._tasks_detector = None
-            if hasattr(self, '_mp'):
-                self._mp = None
+    def close(self) -> None:
+        """Release the MediaPipe graphs. Safe to call more than once."""
+        self._finalizer()
+        self._solutions_detector = None
+        self._tasks_detector = None
+        self._onnx_session = None
+        self._mp = None
 
-    def detect(self, frame: Any) -> list[FaceBox]:
-        if self._mp is None:
+    def __enter__(self) -> BlazeFaceFaceDetector:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def detect(self, frame: Any, preproc: _FramePreproc | None = None) -> list[FaceBox]:
+        """Detect faces in a BGR frame.
+
+        preproc lets a caller share its RGB conversion of the same frame; when omitted
+        a private cache is used.
+        """
+        if self._mp is None and self._onnx_session is None:
             return []
 
         frame_height, frame_width = frame.shape[:2]
@@ -137,59 +461,53 @@ class BlazeFaceFaceDetector:
         except ImportError:
             return []
 
-        infer_frame = frame
-        infer_width = frame_width
-        infer_height = frame_height
-        scale_x = 1.0
-        scale_y = 1.0
-
-        max_infer_width = 640
-        if frame_width > max_infer_width:
-            infer_width = max_infer_width
-            infer_height = max(1, int(frame_height * (infer_width / frame_width)))
-            if self._compute_device == "gpu" and hasattr(cv2, "ocl") and cv2.ocl.haveOpenCL():
-                infer_frame = cv2.resize(cv2.UMat(frame), (infer_width, infer_height)).get()
-            else:
-                infer_frame = cv2.resize(frame, (infer_width, infer_height))
-            scale_x = frame_width / infer_width
-            scale_y = frame_height / infer_height
+        if preproc is None:
+            if self._preproc is None:
+                self._preproc = _FramePreproc(cv2)
+            preproc = self._preproc
 
-        if self._compute_device == "gpu" and hasattr(cv2, "ocl") and cv2.ocl.haveOpenCL():
-            rgb = cv2.cvtColor(cv2.UMat(infer_frame), cv2.COLOR_BGR2RGB).get()
-        else:
-            rgb = cv2.cvtColor(infer_frame, cv2.COLOR_BGR2RGB)
+        rgb = preproc.rgb_downscaled(frame, INFER_MAX_WIDTH)
+        infer_height, infer_width = rgb.shape[:2]
+        scale_x = frame_width / infer_width
+        scale_y = frame_height / infer_height
+
+        # ONNX Runtime
+        if self._onnx_session is not None:
+            try:
+                relative_boxes = self._onnx_session.detect(rgb)
+            except Exception:
+                relative_boxes = []
+
+            rows = [
+                (xmin * infer_width, ymin * infer_height, width * infer_width, height * infer_height)
+                for xmin, ymin, width, height in relative_boxes
+            ]
+            return _clamp_boxes(rows, scale_x, scale_y, frame_width, frame_height)
 
         # Tasks (GPU)
         if self._tasks_detector is not None:
             try:
-                mp_image = self._mp.Image(image_format=self._mp.ImageFormat.SRGB, data=rgb)
-                result = self._tasks_detector.detect(mp_image)
+                mp_image = preproc.mp_image(frame, self._mp, INFER_MAX_WIDTH)
+                self._tasks_timestamp_ms = _next_timestamp_ms(self._tasks_timestamp_ms)
+                result = self._tasks_detector.detect_for_video(mp_image, self._tasks_timestamp_ms)
                 detections = getattr(result, "detections", None) or []
             except Exception:
                 detections = []
 
-            boxes: list[FaceBox] = []
+            rows = []
             for detection in detections:
                 bbox = getattr(detection, "bounding_box", None)
                 if bbox is None:
                     continue
-                x = int(getattr(bbox, "origin_x", 0))
-                y = int(getattr(bbox, "origin_y", 0))
-                w = int(getattr(bbox, "width", 0))
-                h = int(getattr(bbox, "height", 0))
-
-                x = int(x * scale_x)
-                y = int(y * scale_y)
-                w = int(w * scale_x)
-                h = int(h * scale_y)
-
-                x = max(0, min(x, frame_width - 1))
-                y = max(0, min(y, frame_height - 1))
-                w = max(0, min(w, frame_width - x))
-                h = max(0, min(h, frame_height - y))
-                if w > 0 and h > 0:
-                    boxes.append((x, y, w, h))
-            return boxes
+                rows.append(
+                    (
+                        int(getattr(bbox, "origin_x", 0)),
+                        int(getattr(bbox, "origin_y", 0)),
+                        int(getattr(bbox, "width", 0)),
+                        int(getattr(bbox, "height", 0)),
+                    )
+                )
+            return _clamp_boxes(rows, scale_x, scale_y, frame_width, frame_height)
 
         # Solutions (CPU)
         if self._solutions_detector is None:
@@ -199,27 +517,18 @@ class BlazeFaceFaceDetector:
         if not result.detections:
             return []
 
-        boxes: list[FaceBox] = []
+        rows = []
         for detection in result.detections:
             relative_box = detection.location_data.relative_bounding_box
-            x = int(relative_box.xmin * infer_width)
-            y = int(relative_box.ymin * infer_height)
-            w = int(relative_box.width * infer_width)
-            h = int(relative_box.height * infer_height)
-
-            x = int(x * scale_x)
-            y = int(y * scale_y)
-            w = int(w * scale_x)
-            h = int(h * scale_y)
-
-            x = max(0, min(x, frame_width - 1))
-            y = max(0, min(y, frame_height - 1))
-            w = max(0, min(w, frame_width - x))
-            h = max(0, min(h, frame_height - y))
-            if w > 0 and h > 0:
-                boxes.append((x, y, w, h))
-
-        return boxes
+            rows.append(
+                (
+                    int(relative_box.xmin * infer_width),
+                    int(relative_box.ymin * infer_height),
+                    int(relative_box.width * infer_width),
+                    int(relative_box.height * infer_height),
+                )
+            )
+        return _clamp_boxes(rows, scale_x, scale_y, frame_width, frame_height)
 
 
 class HeadRatioPostureDetector:
@@ -233,11 +542,16 @@ class HeadRatioPostureDetector:
         hunchback_threshold_degrees: float = DEFAULT_HUNCHBACK_THRESHOLD_DEGREES,
         ear_span_too_close_threshold: float = DEFAULT_EAR_SPAN_TOO_CLOSE_THRESHOLD,
         compute_device: str = "cpu",
-        pose_model_complexity: int = 1,
+        pose_model_complexity: int = 0,
         camera_angle_mode: str = "upper_body",
         ema_alpha: float = 0.25,
+        debug: bool = False,
+        face_redetect_interval: int = 5,
+        interleave_modalities: bool = False,
+        static_frame_threshold: float = 2.0,
     ) -> None:
         self.compute_device = effective_compute_device(compute_device)
+        self._owns_face_detector = face_detector is None
         self.face_detector = face_detector or BlazeFaceFaceDetector(compute_device=self.compute_device)
         self.ratio_threshold = ratio_threshold
         self.pose_visibility_threshold = pose_visibility_threshold
@@ -248,6 +562,18 @@ class HeadRatioPostureDetector:
         self.pose_model_complexity = max(0, min(2, pose_model_complexity))
         self.camera_angle_mode = camera_angle_mode
         self.ema_alpha = ema_alpha
+        # When False, results carry an empty pose_debug mapping instead of a per-frame dict.
+        self.debug = debug
+        # Run BlazeFace at most every N frames; in between the last box is reused while
+        # the pose ear landmarks still fall inside it and it is under
+        # FACE_BOX_REUSE_MAX_AGE_SECONDS old.
+        self.face_redetect_interval = max(1, int(face_redetect_interval))
+        # Alternate face detection (even frames) and pose inference (odd frames), carrying
+        # the other modality over from the last frame that measured it.
+        self.interleave_modalities = interleave_modalities
+        # Mean absolute difference (0-255 gray levels) of a 32x32 thumbnail below which a
+        # frame counts as unchanged and the previous result is returned; 0 disables.
+        self.static_frame_threshold = static_frame_threshold
 
         self._pose = None
         self._pose_tasks = None
@@ -255,12 +581,65 @@ class HeadRatioPostureDetector:
         self._pose_gpu_init_error: str | None = None
         self._mp = None
         self._cv2 = None
-        self._pose_landmark_ids: dict[str, int] = {}
+        self._landmark_buf: Any = None
+        self._landmark_buf_source: Any = None
+        self._head_index_array: Any = None
+        self._world_buf: Any = None
         self._pose_connections: tuple[PoseConnection, ...] = ()
         self._smoothed_head_forward: float | None = None
         self._smoothed_trunk_angle: float | None = None
+        self._last_pose_snapshot: _PoseSnapshot = _POSE_UNAVAILABLE
+        self._last_frame_shape: tuple[int, ...] = ()
+        self._last_frame_area = 0
+        self._face_box_cache: FaceBox | None = None
+        self._face_box_cache_shape: tuple[int, ...] = ()
+        self._face_box_cache_time = 0.0
+        self._frames_since_face_detect = 0
+        self._frames_without_face = 0
+        self._frame_index = 0
+        self._last_pose_output: tuple[str, tuple[str, ...], tuple[PoseLandmarkPoint, ...], _PoseSnapshot] | None = None
+        self._last_signature: Any = None
+        self._last_result: HeadRatioResult | None = None
+        self._last_result_key: tuple[object, ...] = ()
+        self._preproc: _FramePreproc | None = None
+        self._pose_timestamp_ms = 0
+
+        # Face and pose inference both run in native code that releases the GIL, so the
+        # face detector runs on a worker thread while pose runs on the calling thread.
+        # The lock serializes evaluate_frame because the EMA state and MediaPipe graphs
+        # are not safe for concurrent use.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sitalarm-face")
+        self._evaluate_lock = threading.Lock()
 
         self._init_pose_detector()
+        self._finalizer = weakref.finalize(
+            self,
+            _close_resources,
+            self._executor,
+            self._pose,
+            self._pose_tasks,
+        )
+
+    def close(self) -> None:
+        """Release the pose graphs, the face worker and an owned face detector.
+
+        Safe to call more than once; waits for an in-flight evaluate_frame to finish.
+        """
+        with self._evaluate_lock:
+            self._finalizer()
+            self._pose = None
+            self._pose_tasks = None
+            self._mp = None
+            self._cv2 = None
+            self._preproc = None
+            if self._owns_face_detector:
+                self.face_detector.close()
+
+    def __enter__(self) -> HeadRatioPostureDetector:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def backend_details(self) -> dict[str, object]:
         face_backend = getattr(self.face_detector, "backend_name", lambda: "unknown")()
@@ -274,11 +653,232 @@ class HeadRatioPostureDetector:
             "compute_device": self.compute_device,
         }
 
+    @property
+    def pose_debug(self) -> dict[str, object]:
+        """Debug details for the most recent pose evaluation, built on demand."""
+        snapshot = self._last_pose_snapshot
+        if not snapshot.pose_available:
+            return {"pose_available": False}
+
+        debug: dict[str, object] = {
+            "pose_available": True,
+            "pose_detected": snapshot.pose_detected,
+            "pose_backend": self._pose_backend,
+            "compute_device": self.compute_device,
+            "pose_gpu_init_error": self._pose_gpu_init_error,
+        }
+        if not snapshot.pose_detected:
+            return debug
+
+        ear_span_ratio = snapshot.ear_span_ratio
+        debug.update(
+            {
+                "model_complexity": self.pose_model_complexity,
+                "camera_angle_mode": self.camera_angle_mode,
+                "shoulder_visibility": snapshot.shoulder_visibility,
+                "hip_visibility": snapshot.hip_visibility,
+                "ear_span_ratio": ear_span_ratio,
+                "head_too_close_proxy": bool(
+                    ear_span_ratio is not None and ear_span_ratio >= self.ear_span_too_close_threshold
+                ),
+                "threshold_ear_span_too_close": self.ear_span_too_close_threshold,
+                "pose_visibility_ok": snapshot.head_forward_ratio is not None,
+            }
+        )
+        if snapshot.head_forward_ratio is not None:
+            debug.update(
+                {
+                    "upper_body_mode": snapshot.upper_body_mode,
+                    "head_forward_ratio": snapshot.head_forward_ratio,
+                    "trunk_angle_degrees": snapshot.trunk_angle,
+                    "threshold_head_forward": snapshot.head_forward_threshold,
+                    "threshold_head_forward_base": self.head_forward_threshold,
+                    "threshold_hunchback": self.hunchback_threshold_degrees,
+                    "ema_alpha": self.ema_alpha,
+                }
+            )
+        return debug
+
+    def evaluate_frame(self, frame: Any, fresh: bool = False) -> HeadRatioResult:
+        """Evaluate one BGR frame.
+
+        fresh=True runs face detection and pose on this frame instead of reusing state
+        carried over from earlier frames; use it for scheduled and calibration captures.
+        """
+        with self._evaluate_lock:
+            return self._evaluate_frame_locked(frame, fresh)
+
+    def evaluate_frames(self, frames: Iterable[Any]) -> list[HeadRatioResult]:
+        """Evaluate a small batch of frames back to back, returning results in order.
+
+        The lock is taken once for the whole batch so the face and pose graphs run
+        consecutively on warm weights instead of interleaving with other callers.
+        """
+        with self._evaluate_lock:
+            return [self._evaluate_frame_locked(frame) for frame in frames]
+
+    def evaluate_stream(self, frames: Iterable[Any]) -> Iterator[HeadRatioResult]:
+        """Evaluate frames from an iterable (e.g. a camera read loop), yielding results in order.
+
+        A reader thread pulls the next frame while an inference thread evaluates the
+        current one; both hand off through 2-slot queues so neither side runs ahead.
+        Errors raised by the frame source are re-raised from the generator.
+        """
+        read_q: queue.Queue[tuple[str, Any]] = queue.Queue(maxsize=2)
+        result_q: queue.Queue[tuple[str, Any]] = queue.Queue(maxsize=2)
+        stop = threading.Event()
+
+        def put(target: queue.Queue[tuple[str, Any]], item: tuple[str, Any]) -> bool:
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def read_frames() -> None:
+            try:
+                for frame in frames:
+                    if not put(read_q, ("frame", frame)):
+                        return
+            except Exception as exc:
+                put(read_q, ("error", exc))
+                return
+            put(read_q, ("end", None))
 
-    def evaluate_frame(self, frame: Any) -> HeadRatioResult:
-        faces = self.face_detector.detect(frame)
-        face_box = max(faces, key=self._face_area) if faces else None
-        head_ratio = self.calculate_head_ratio(face_box, frame.shape) if face_box else None
+        def run_inference() -> None:
+            while not stop.is_set():
+                try:
+                    kind, payload = read_q.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if kind == "frame":
+                    try:
+                        item = ("result", self.evaluate_frame(payload))
+                    except Exception as exc:
+                        item = ("error", exc)
+                else:
+                    item = (kind, payload)
+                if not put(result_q, item) or item[0] != "result":
+                    return
+
+        threads = (
+            threading.Thread(target=read_frames, name="sitalarm-stream-read", daemon=True),
+            threading.Thread(target=run_inference, name="sitalarm-stream-infer", daemon=True),
+        )
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                kind, payload = result_q.get()
+                if kind == "result":
+                    yield payload
+                elif kind == "error":
+                    raise payload
+                else:
+                    return
+        finally:
+            stop.set()
+
+    def _submit_face_detection(self, frame: Any) -> Future:
+        preproc = self._preproc
+        if preproc is not None and isinstance(self.face_detector, BlazeFaceFaceDetector):
+            # Convert and downscale once up front; both stages then read the cached image.
+            preproc.rgb_downscaled(frame, INFER_MAX_WIDTH)
+            return self._executor.submit(self.face_detector.detect, frame, preproc)
+        return self._executor.submit(self.face_detector.detect, frame)
+
+    def _frame_signature(self, frame: Any) -> Any:
+        """32x32 grayscale thumbnail used to spot frames identical to the last evaluated one."""
+        cv2 = self._cv2
+        if cv2 is None or np is None or self.static_frame_threshold <= 0:
+            return None
+        # Shrink first so the color conversion only touches 1024 pixels.
+        thumb = cv2.resize(frame, (32, 32), interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(thumb, cv2.COLOR_BGR2GRAY).astype(np.int16)
+
+    def _evaluate_frame_locked(self, frame: Any, fresh: bool = False) -> HeadRatioResult:
+        frame_shape = frame.shape[:2]
+        # Every setting that changes the result; a reused result must match all of them.
+        result_key = (
+            frame_shape,
+            self.ratio_threshold,
+            self.head_forward_threshold,
+            self.hunchback_threshold_degrees,
+            self.ear_span_too_close_threshold,
+            self.pose_visibility_threshold,
+            self.hip_visibility_threshold,
+            self.camera_angle_mode,
+            self.debug,
+        )
+        signature = self._frame_signature(frame)
+        if (
+            not fresh
+            and signature is not None
+            and self._last_result is not None
+            and self._last_result_key == result_key
+            and float(np.abs(signature - self._last_signature).mean()) < self.static_frame_threshold
+        ):
+            # The signature stays that of the last evaluated frame, so slow drift still
+            # accumulates until it crosses the threshold.
+            return self._last_result
+
+        self._frame_index += 1
+        face_cache_usable = (
+            not fresh
+            and self._face_box_cache_shape == frame_shape
+            and time.monotonic() - self._face_box_cache_time <= FACE_BOX_REUSE_MAX_AGE_SECONDS
+        )
+        skip_pose = False
+        skip_face = False
+        if self.interleave_modalities and not fresh:
+            if self._frame_index % 2 == 0:
+                skip_pose = self._last_pose_output is not None
+            else:
+                skip_face = face_cache_usable
+        if (
+            not skip_pose
+            and not fresh
+            and self._frames_without_face > POSE_SKIP_AFTER_FACELESS_FRAMES
+            and self._last_pose_output is not None
+            and self._last_pose_output[3] is _POSE_NOT_DETECTED
+        ):
+            skip_pose = True
+
+        reuse_face = skip_face or (
+            face_cache_usable
+            and self._face_box_cache is not None
+            and self._frames_since_face_detect < self.face_redetect_interval
+        )
+        faces_future = None if reuse_face else self._submit_face_detection(frame)
+        try:
+            if skip_pose:
+                # Carried pose values are already EMA-smoothed, so they stand in for this frame.
+                pose_status, pose_reasons, landmarks, snapshot = self._last_pose_output
+            else:
+                pose_status, pose_reasons, landmarks, snapshot = self._evaluate_pose(frame)
+                self._last_pose_output = (pose_status, pose_reasons, landmarks, snapshot)
+            self._last_pose_snapshot = snapshot
+        finally:
+            faces = faces_future.result() if faces_future is not None else None
+
+        if faces is None:
+            if skip_face:
+                face_box = self._face_box_cache
+            elif self._face_box_tracks_pose(self._face_box_cache, landmarks):
+                self._frames_since_face_detect += 1
+                face_box = self._face_box_cache
+            else:
+                faces = self._submit_face_detection(frame).result()
+        if faces is not None:
+            face_box = max(faces, key=self._face_area) if faces else None
+            self._face_box_cache = face_box
+            self._face_box_cache_shape = frame_shape
+            self._face_box_cache_time = time.monotonic()
+            self._frames_since_face_detect = 1
+        self._frames_without_face = 0 if face_box is not None else self._frames_without_face + 1
+        head_ratio = self._frame_head_ratio(face_box, frame.shape) if face_box else None
 
         distance_status = "unknown"
         too_close = False
@@ -286,12 +886,19 @@ class HeadRatioPostureDetector:
             too_close = head_ratio >= self.ratio_threshold
             distance_status = "too_close" if too_close else "normal"
 
-        pose_status, pose_reasons, landmarks, pose_debug = self._evaluate_pose(frame)
-        pose_debug.setdefault("face_backend", getattr(self.face_detector, "backend_name", lambda: "unknown")())
-        pose_debug.setdefault("backend_details", self.backend_details())
+        pose_debug: Mapping[str, object] = _EMPTY_DEBUG
+        if self.debug:
+            debug_info = self.pose_debug
+            debug_info["face_backend"] = getattr(self.face_detector, "backend_name", lambda: "unknown")()
+            debug_info["backend_details"] = self.backend_details()
+            pose_debug = debug_info
 
         # Fallback for near-camera scenes when face box detection fails.
-        if head_ratio is None and bool(pose_debug.get("head_too_close_proxy", False)):
+        head_too_close_proxy = (
+            snapshot.ear_span_ratio is not None
+            and snapshot.ear_span_ratio >= self.ear_span_too_close_threshold
+        )
+        if head_ratio is None and head_too_close_proxy:
             too_close = True
             distance_status = "too_close_proxy"
 
@@ -308,7 +915,7 @@ class HeadRatioPostureDetector:
         else:
             status = "unknown"
 
-        return HeadRatioResult(
+        result = HeadRatioResult(
             status=status,
             reasons=tuple(reasons),
             head_ratio=head_ratio,
@@ -318,8 +925,14 @@ class HeadRatioPostureDetector:
             distance_status=distance_status,
             pose_landmarks=landmarks,
             pose_connections=self._pose_connections,
+            head_forward_ratio=snapshot.head_forward_ratio,
+            head_forward_threshold=snapshot.head_forward_threshold,
             pose_debug=pose_debug,
         )
+        self._last_signature = signature
+        self._last_result = result if signature is not None else None
+        self._last_result_key = result_key
+        return result
 
     @staticmethod
     def recommend_threshold(
@@ -329,15 +942,22 @@ class HeadRatioPostureDetector:
         if len(correct_ratios) < 2:
             raise ValueError("At least two correct-posture samples are required for calibration.")
 
-        import math as _math
-
         margin = max(0.0, safety_margin)
-        max_ratio = max(correct_ratios)
-        mean_ratio = sum(correct_ratios) / len(correct_ratios)
+        if np is not None:
+            samples = np.asarray(correct_ratios, dtype=np.float64)
+            max_ratio = float(samples.max())
+            mean_ratio = float(samples.mean())
+            # Population stddev (ddof=0), same as the pure-Python path below.
+            stddev = float(samples.std()) if samples.size >= 3 else 0.0
+        else:
+            max_ratio = max(correct_ratios)
+            mean_ratio = sum(correct_ratios) / len(correct_ratios)
+            stddev = 0.0
+            if len(correct_ratios) >= 3:
+                variance = sum((r - mean_ratio) ** 2 for r in correct_ratios) / len(correct_ratios)
+                stddev = math.sqrt(variance)
         # Use whichever is larger: max-based or (mean + 1 stddev)-based.
         if len(correct_ratios) >= 3:
-            variance = sum((r - mean_ratio) ** 2 for r in correct_ratios) / len(correct_ratios)
-            stddev = _math.sqrt(variance)
             base = max(max_ratio, mean_ratio + stddev)
         else:
             base = max_ratio
@@ -349,14 +969,46 @@ class HeadRatioPostureDetector:
         if frame_width <= 0 or frame_height <= 0:
             return 0.0
 
-        _, _, width, height = face_box
-        face_area = max(0, width) * max(0, height)
-        frame_area = frame_width * frame_height
-        return face_area / frame_area
+        return HeadRatioPostureDetector._face_area(face_box) / (frame_width * frame_height)
+
+    def _face_box_tracks_pose(self, face_box: FaceBox | None, landmarks: tuple[PoseLandmarkPoint, ...]) -> bool:
+        """True when the visible pose ear landmarks still sit inside the (padded) face box."""
+        if face_box is None:
+            return False
+        if not landmarks:
+            # No pose to check against: only trust the box when pose is not running at all.
+            return self._pose is None and self._pose_tasks is None
+
+        x, y, w, h = face_box
+        pad_x = w * 0.25
+        pad_y = h * 0.25
+        checked = 0
+        for idx in (_LEFT_EAR, _RIGHT_EAR):
+            px, py, visibility = landmarks[idx]
+            if visibility < _LANDMARK_VISIBILITY:
+                continue
+            if not (x - pad_x <= px <= x + w + pad_x and y - pad_y <= py <= y + h + pad_y):
+                return False
+            checked += 1
+        return checked > 0
+
+    def _frame_head_ratio(self, face_box: FaceBox, frame_shape: tuple[int, ...]) -> float:
+        # The camera resolution rarely changes, so the frame area is cached per shape.
+        shape = frame_shape[:2]
+        if shape != self._last_frame_shape:
+            frame_height, frame_width = shape
+            self._last_frame_shape = shape
+            self._last_frame_area = frame_width * frame_height if frame_width > 0 and frame_height > 0 else 0
+        if not self._last_frame_area:
+            return 0.0
+        return self._face_area(face_box) / self._last_frame_area
 
     @staticmethod
     def _face_area(face_box: FaceBox) -> int:
-        return max(0, face_box[2]) * max(0, face_box[3])
+        # Branchless clamp: v & -(v > 0) is v for positive ints and 0 otherwise.
+        width = face_box[2]
+        height = face_box[3]
+        return (width & -(width > 0)) * (height & -(height > 0))
 
     def _init_pose_detector(self) -> None:
         # Reset before init.
@@ -373,17 +1025,11 @@ class HeadRatioPostureDetector:
 
         self._cv2 = cv2
         self._mp = mp
+        self._preproc = _FramePreproc(cv2)
 
-        # Landmark indices are stable across Solutions/Tasks.
-        self._pose_landmark_ids = {
-            "nose": 0,
-            "left_ear": 7,
-            "right_ear": 8,
-            "left_shoulder": 11,
-            "right_shoulder": 12,
-            "left_hip": 23,
-            "right_hip": 24,
-        }
+        if np is not None:
+            self._head_index_array = np.asarray(_HEAD_LANDMARK_IDS, dtype=np.intp)
+            self._world_buf = np.empty((len(_HEAD_LANDMARK_IDS) + 2, 3), dtype=np.float64)
         try:
             self._pose_connections = tuple((int(a), int(b)) for a, b in mp.solutions.pose.POSE_CONNECTIONS)
         except Exception:
@@ -402,7 +1048,9 @@ class HeadRatioPostureDetector:
                         model_asset_path=str(model_path),
                         delegate=BaseOptions.Delegate.GPU,
                     ),
-                    running_mode=VisionTaskRunningMode.IMAGE,
+                    # VIDEO mode keeps the landmark tracker warm between frames, so the
+                    # person detector only reruns when tracking is lost.
+                    running_mode=VisionTaskRunningMode.VIDEO,
                     num_poses=1,
                     min_pose_detection_confidence=0.5,
                     min_pose_presence_confidence=0.5,
@@ -434,32 +1082,23 @@ class HeadRatioPostureDetector:
     def _evaluate_pose(
         self,
         frame: Any,
-    ) -> tuple[str, tuple[str, ...], tuple[PoseLandmarkPoint, ...], dict[str, object]]:
+    ) -> tuple[str, tuple[str, ...], tuple[PoseLandmarkPoint, ...], _PoseSnapshot]:
         if self._cv2 is None:
-            return "unknown", (), (), {"pose_available": False}
+            return "unknown", (), (), _POSE_UNAVAILABLE
 
         frame_height, frame_width = frame.shape[:2]
 
-        if self.compute_device == "gpu" and hasattr(self._cv2, "ocl") and self._cv2.ocl.haveOpenCL():
-            rgb = self._cv2.cvtColor(self._cv2.UMat(frame), self._cv2.COLOR_BGR2RGB).get()
-        else:
-            rgb = self._cv2.cvtColor(frame, self._cv2.COLOR_BGR2RGB)
-
         image_landmarks = None
         world_landmarks = None
 
         if self._pose_tasks is not None and self._mp is not None:
             try:
-                mp_image = self._mp.Image(image_format=self._mp.ImageFormat.SRGB, data=rgb)
-                result = self._pose_tasks.detect(mp_image)
+                # Same downscaled image the face detector uses; landmarks are normalized.
+                mp_image = self._preproc.mp_image(frame, self._mp, INFER_MAX_WIDTH)
+                self._pose_timestamp_ms = _next_timestamp_ms(self._pose_timestamp_ms)
+                result = self._pose_tasks.detect_for_video(mp_image, self._pose_timestamp_ms)
                 if not getattr(result, "pose_landmarks", None):
-                    return "unknown", (), (), {
-                        "pose_available": True,
-                        "pose_detected": False,
-                        "pose_backend": self._pose_backend,
-                        "compute_device": self.compute_device,
-            "pose_gpu_init_error": self._pose_gpu_init_error,
-                    }
+                    return "unknown", (), (), _POSE_NOT_DETECTED
 
                 image_landmarks = result.pose_landmarks[0]
                 if getattr(result, "pose_world_landmarks", None):
@@ -469,71 +1108,38 @@ class HeadRatioPostureDetector:
 
         if image_landmarks is None:
             if self._pose is None:
-                return "unknown", (), (), {"pose_available": False}
+                return "unknown", (), (), _POSE_UNAVAILABLE
 
-            result = self._pose.process(rgb)
+            result = self._pose.process(self._preproc.rgb_downscaled(frame, INFER_MAX_WIDTH))
             if not result.pose_landmarks:
-                return "unknown", (), (), {
-                    "pose_available": True,
-                    "pose_detected": False,
-                    "pose_backend": self._pose_backend,
-                    "compute_device": self.compute_device,
-            "pose_gpu_init_error": self._pose_gpu_init_error,
-                }
+                return "unknown", (), (), _POSE_NOT_DETECTED
 
             image_landmarks = result.pose_landmarks.landmark
             world_landmarks = result.pose_world_landmarks.landmark if result.pose_world_landmarks else None
 
         points = self._pack_landmarks(image_landmarks, frame_width, frame_height)
 
-        id_map = self._pose_landmark_ids
-        left_shoulder = image_landmarks[id_map["left_shoulder"]]
-        right_shoulder = image_landmarks[id_map["right_shoulder"]]
-        left_hip = image_landmarks[id_map["left_hip"]]
-        right_hip = image_landmarks[id_map["right_hip"]]
+        left_shoulder = image_landmarks[_LEFT_SHOULDER]
+        right_shoulder = image_landmarks[_RIGHT_SHOULDER]
+        left_hip = image_landmarks[_LEFT_HIP]
+        right_hip = image_landmarks[_RIGHT_HIP]
 
         shoulder_visibility = (self._vis(left_shoulder) + self._vis(right_shoulder)) / 2.0
         hip_visibility = (self._vis(left_hip) + self._vis(right_hip)) / 2.0
         ear_span_ratio = self._ear_span_ratio(image_landmarks)
 
-        debug: dict[str, object] = {
-            "pose_available": True,
-            "pose_detected": True,
-            "pose_backend": self._pose_backend,
-            "compute_device": self.compute_device,
-            "pose_gpu_init_error": self._pose_gpu_init_error,
-            "model_complexity": self.pose_model_complexity,
-            "camera_angle_mode": self.camera_angle_mode,
-            "shoulder_visibility": round(shoulder_visibility, 4),
-            "hip_visibility": round(hip_visibility, 4),
-            "ear_span_ratio": round(ear_span_ratio, 4) if ear_span_ratio is not None else None,
-            "head_too_close_proxy": bool(
-                ear_span_ratio is not None and ear_span_ratio >= self.ear_span_too_close_threshold
-            ),
-            "threshold_ear_span_too_close": round(self.ear_span_too_close_threshold, 4),
-        }
-
-        if shoulder_visibility < self.pose_visibility_threshold:
-            debug["pose_visibility_ok"] = False
-            return "unknown", (), points, debug
-
-        head_forward_ratio = self._head_forward_ratio(image_landmarks, world_landmarks)
-        if head_forward_ratio is None:
-            debug["pose_visibility_ok"] = False
-            return "unknown", (), points, debug
-
-        head_forward_ratio = self._ema(self._smoothed_head_forward, head_forward_ratio, self.ema_alpha)
-        self._smoothed_head_forward = head_forward_ratio
+        # Raw measurements first; smoothing and classification happen in _score_pose.
+        head_forward_raw: float | None = None
+        if shoulder_visibility >= self.pose_visibility_threshold:
+            head_forward_raw = self._head_forward_ratio(image_landmarks, world_landmarks)
 
-        # Determine if we're in upper body mode (hips not visible or user configured)
+        # Upper body mode: hips not visible or user configured.
         upper_body_mode = (
             self.camera_angle_mode == "upper_body"
             or hip_visibility < self.hip_visibility_threshold
         )
-        debug["upper_body_mode"] = upper_body_mode
-
-        trunk_angle: float | None = None
-        if not upper_body_mode and hip_visibility >= self.hip_visibility_threshold:
+        trunk_angle_raw: float | None = None
+        if head_forward_raw is not None and not upper_body_mode:
             shoulder_center = (
                 (left_shoulder.x + right_shoulder.x) / 2.0,
                 (left_shoulder.y + right_shoulder.y) / 2.0,
@@ -543,37 +1149,35 @@ class HeadRatioPostureDetector:
                 (left_hip.y + right_hip.y) / 2.0,
             )
             trunk_angle_raw = self._trunk_angle_degrees(shoulder_center, hip_center)
-            if trunk_angle_raw is not None:
-                trunk_angle = self._ema(self._smoothed_trunk_angle, trunk_angle_raw, self.ema_alpha)
-                self._smoothed_trunk_angle = trunk_angle
-
-        # Adjust head forward threshold for upper body / laptop webcam mode.
-        # Low-angle cameras exaggerate the perceived head-forward offset due to
-        # perspective distortion, so we RELAX the threshold to compensate.
-        effective_head_forward_threshold = self.head_forward_threshold
-        if upper_body_mode:
-            effective_head_forward_threshold = self.head_forward_threshold * 1.15
 
-        reasons: list[str] = []
-        if head_forward_ratio >= effective_head_forward_threshold:
-            reasons.append("head_forward")
-        if trunk_angle is not None and trunk_angle >= self.hunchback_threshold_degrees:
-            reasons.append("hunchback")
-
-        debug.update(
-            {
-                "pose_visibility_ok": True,
-                "head_forward_ratio": round(head_forward_ratio, 4),
-                "trunk_angle_degrees": round(trunk_angle, 4) if trunk_angle is not None else None,
-                "threshold_head_forward": round(effective_head_forward_threshold, 4),
-                "threshold_head_forward_base": round(self.head_forward_threshold, 4),
-                "threshold_hunchback": round(self.hunchback_threshold_degrees, 4),
-                "ema_alpha": self.ema_alpha,
-            }
+        status, reasons, head_forward_ratio, trunk_angle, effective_head_forward_threshold = _score_pose(
+            head_forward_raw,
+            trunk_angle_raw,
+            self._smoothed_head_forward,
+            self._smoothed_trunk_angle,
+            self.ema_alpha,
+            self.head_forward_threshold,
+            self.hunchback_threshold_degrees,
+            upper_body_mode,
         )
+        if head_forward_ratio is not None:
+            self._smoothed_head_forward = head_forward_ratio
+        if trunk_angle is not None:
+            self._smoothed_trunk_angle = trunk_angle
+
+        snapshot = _PoseSnapshot(
+            pose_available=True,
+            pose_detected=True,
+            shoulder_visibility=shoulder_visibility,
+            hip_visibility=hip_visibility,
+            ear_span_ratio=ear_span_ratio,
+            upper_body_mode=upper_body_mode,
+            head_forward_ratio=head_forward_ratio,
+            trunk_angle=trunk_angle,
+            head_forward_threshold=effective_head_forward_threshold,
+        )
+        return status, reasons, points, snapshot
 
-        status = "incorrect" if reasons else "correct"
-        return status, tuple(reasons), points, debug
     @staticmethod
     def _vis(lm: Any) -> float:
         value = getattr(lm, "visibility", 0.0)
@@ -581,13 +1185,15 @@ class HeadRatioPostureDetector:
 
 
     def _head_forward_ratio(self, image_landmarks: Any, world_landmarks: Any) -> float | None:
-        ids = self._pose_landmark_ids
-        left_shoulder = image_landmarks[ids["left_shoulder"]]
-        right_shoulder = image_landmarks[ids["right_shoulder"]]
+        if np is not None and self._landmark_buf_source is image_landmarks:
+            return self._head_forward_ratio_packed(world_landmarks)
+
+        left_shoulder = image_landmarks[_LEFT_SHOULDER]
+        right_shoulder = image_landmarks[_RIGHT_SHOULDER]
 
         if world_landmarks is not None:
-            left_shoulder_w = world_landmarks[ids["left_shoulder"]]
-            right_shoulder_w = world_landmarks[ids["right_shoulder"]]
+            left_shoulder_w = world_landmarks[_LEFT_SHOULDER]
+            right_shoulder_w = world_landmarks[_RIGHT_SHOULDER]
             shoulder_width_world = self._dist3(
                 left_shoulder_w.x,
                 left_shoulder_w.y,
@@ -597,35 +1203,65 @@ class HeadRatioPostureDetector:
                 right_shoulder_w.z,
             )
             if shoulder_width_world > 1e-6:
-                head_z_values: list[float] = []
-                for name in ("nose", "left_ear", "right_ear"):
-                    idx = ids[name]
-                    if self._vis(image_landmarks[idx]) >= 0.35:
-                        head_z_values.append(float(world_landmarks[idx].z))
-                if head_z_values:
+                # At most three head points: keep a running sum instead of building a list.
+                head_z_sum = 0.0
+                head_z_count = 0
+                for idx in _HEAD_LANDMARK_IDS:
+                    if self._vis(image_landmarks[idx]) >= _LANDMARK_VISIBILITY:
+                        head_z_sum += float(world_landmarks[idx].z)
+                        head_z_count += 1
+                if head_z_count:
                     shoulder_z = (float(left_shoulder_w.z) + float(right_shoulder_w.z)) / 2.0
-                    head_z = sum(head_z_values) / len(head_z_values)
+                    head_z = head_z_sum / head_z_count
                     return (shoulder_z - head_z) / shoulder_width_world
 
-        visible_x: list[float] = []
-        for name in ("nose", "left_ear", "right_ear"):
-            idx = ids[name]
-            if self._vis(image_landmarks[idx]) >= 0.35:
-                visible_x.append(float(image_landmarks[idx].x))
+        head_x_sum = 0.0
+        head_x_count = 0
+        for idx in _HEAD_LANDMARK_IDS:
+            if self._vis(image_landmarks[idx]) >= _LANDMARK_VISIBILITY:
+                head_x_sum += float(image_landmarks[idx].x)
+                head_x_count += 1
 
         shoulder_width_2d = abs(float(left_shoulder.x) - float(right_shoulder.x))
-        if shoulder_width_2d <= 1e-6 or not visible_x:
+        if shoulder_width_2d <= 1e-6 or not head_x_count:
             return None
 
-        head_x = sum(visible_x) / len(visible_x)
+        head_x = head_x_sum / head_x_count
         shoulder_center_x = (float(left_shoulder.x) + float(right_shoulder.x)) / 2.0
         return abs(head_x - shoulder_center_x) / shoulder_width_2d
 
+    def _head_forward_ratio_packed(self, world_landmarks: Any) -> float | None:
+        """NumPy version of _head_forward_ratio over the (N, 4) buffer filled by _pack_landmarks."""
+        buf = self._landmark_buf
+        head_ids = self._head_index_array
+        head_visible = buf[head_ids, 3] >= _LANDMARK_VISIBILITY
+        any_visible = bool(head_visible.any())
+
+        if world_landmarks is not None and any_visible:
+            # Rows: head points, then left and right shoulder.
+            world = self._world_buf
+            for row, idx in enumerate((*_HEAD_LANDMARK_IDS, _LEFT_SHOULDER, _RIGHT_SHOULDER)):
+                lm = world_landmarks[idx]
+                world[row, 0] = lm.x
+                world[row, 1] = lm.y
+                world[row, 2] = lm.z
+            shoulder_width_world = float(np.linalg.norm(world[-2] - world[-1]))
+            if shoulder_width_world > 1e-6:
+                head_z = world[:-2, 2][head_visible].mean()
+                shoulder_z = world[-2:, 2].mean()
+                return float((shoulder_z - head_z) / shoulder_width_world)
+
+        shoulder_x = buf[(_LEFT_SHOULDER, _RIGHT_SHOULDER), 0]
+        shoulder_width_2d = abs(shoulder_x[0] - shoulder_x[1])
+        if shoulder_width_2d <= 1e-6 or not any_visible:
+            return None
+        head_x = buf[head_ids, 0][head_visible].mean()
+        return float(abs(head_x - shoulder_x.mean()) / shoulder_width_2d)
+
     def _ear_span_ratio(self, image_landmarks: Any) -> float | None:
-        ids = self._pose_landmark_ids
-        left_ear = image_landmarks[ids["left_ear"]]
-        right_ear = image_landmarks[ids["right_ear"]]
-        if self._vis(left_ear) < 0.35 or self._vis(right_ear) < 0.35:
+        left_ear = image_landmarks[_LEFT_EAR]
+        right_ear = image_landmarks[_RIGHT_EAR]
+        if self._vis(left_ear) < _LANDMARK_VISIBILITY or self._vis(right_ear) < _LANDMARK_VISIBILITY:
             return None
         return abs(float(left_ear.x) - float(right_ear.x))
 
@@ -634,52 +1270,48 @@ class HeadRatioPostureDetector:
         shoulder_center: tuple[float, float],
         hip_center: tuple[float, float],
     ) -> float | None:
-        dx = shoulder_center[0] - hip_center[0]
-        dy = shoulder_center[1] - hip_center[1]
-        norm = math.hypot(dx, dy)
-        if norm <= 1e-6:
-            return None
-
-        cos_theta = max(-1.0, min(1.0, (-dy) / norm))
-        return math.degrees(math.acos(cos_theta))
-
-    @staticmethod
-    def _pack_landmarks(landmarks: Any, frame_width: int, frame_height: int) -> tuple[PoseLandmarkPoint, ...]:
-        points: list[PoseLandmarkPoint] = []
-        for lm in landmarks:
-            x = int(max(0.0, min(1.0, float(lm.x))) * frame_width)
-            y = int(max(0.0, min(1.0, float(lm.y))) * frame_height)
-            vis = getattr(lm, "visibility", 0.0)
-            vis_f = float(vis) if isinstance(vis, (int, float)) else 0.0
-            points.append((x, y, vis_f))
-        return tuple(points)
+        angle = _trunk_angle_from_delta(
+            float(shoulder_center[0] - hip_center[0]),
+            float(shoulder_center[1] - hip_center[1]),
+        )
+        return angle if angle >= 0.0 else None
+
+    def _pack_landmarks(self, landmarks: Any, frame_width: int, frame_height: int) -> tuple[PoseLandmarkPoint, ...]:
+        vis = self._vis
+        if np is not None:
+            # One tight loop of attribute reads into a reused buffer, then vectorized
+            # clip/scale/cast. The returned tuple is freshly built since the UI keeps it.
+            # Columns are x, y, z, visibility; _head_forward_ratio reuses the buffer.
+            count = len(landmarks)
+            buf = self._landmark_buf
+            if buf is None or buf.shape[0] != count:
+                buf = self._landmark_buf = np.empty((count, 4), dtype=np.float64)
+            for i, lm in enumerate(landmarks):
+                buf[i, 0] = lm.x
+                buf[i, 1] = lm.y
+                buf[i, 2] = lm.z
+                buf[i, 3] = vis(lm)
+            self._landmark_buf_source = landmarks
+            coords = np.clip(buf[:, :2], 0.0, 1.0)
+            coords *= (frame_width, frame_height)
+            xy = coords.astype(np.int32)
+            return tuple(zip(xy[:, 0].tolist(), xy[:, 1].tolist(), buf[:, 3].tolist()))
+
+        return tuple(
+            (
+                int(max(0.0, min(1.0, float(lm.x))) * frame_width),
+                int(max(0.0, min(1.0, float(lm.y))) * frame_height),
+                vis(lm),
+            )
+            for lm in landmarks
+        )
 
     @staticmethod
     def _ema(previous: float | None, current: float, alpha: float = 0.35) -> float:
         if previous is None:
             return current
-        return alpha * current + (1.0 - alpha) * previous
+        return _ema_step(previous, current, alpha)
 
     @staticmethod
     def _dist3(ax: float, ay: float, az: float, bx: float, by: float, bz: float) -> float:
-        return math.sqrt((ax - bx) ** 2 + (ay - by) ** 2 + (az - bz) ** 2)
-
-
-    def __del__(self):
-        """Release MediaPipe resources when this instance is garbage-collected."""
-        try:
-            if hasattr(self, '_pose') and self._pose is not None:
-                self._pose.close()
-            if hasattr(self, '_pose_tasks') and self._pose_tasks is not None:
-                self._pose_tasks.close()
-        except Exception:
-            pass
-        finally:
-            if hasattr(self, '_pose'):
-                self._pose = None
-            if hasattr(self, '_pose_tasks'):
-                self._pose_tasks = None
-            if hasattr(self, '_mp'):
-                self._mp = None
-            if hasattr(self, '_cv2'):
-                self._cv2 = None
+        return _dist3(float(ax), float(ay), float(az), float(bx), float(by), float(bz))
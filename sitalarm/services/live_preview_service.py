@@ -1,8 +1,123 @@
 from __future__ import annotations
 
+import threading
+import weakref
 from typing import Any
 
-from sitalarm.services.capture_service import CaptureError
+from sitalarm.services.capture_service import CaptureError, configure_low_latency
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - runtime dependency
+    np = None
+
+# Landmarks drawn with the larger marker: nose, ears, shoulders, hips.
+_KEY_POINT_IDS = frozenset({0, 7, 8, 11, 12, 23, 24})
+_MIN_VISIBILITY = 0.35
+# How long read_frame waits for the grabber thread. MSMF/DSHOW webcams can take several
+# seconds to deliver their first frame, so that wait is longer.
+_FIRST_FRAME_TIMEOUT_SECONDS = 10.0
+_READ_TIMEOUT_SECONDS = 1.0
+# Reads that time out are bridged with the previous frame; this many in a row is a failure.
+_MAX_CONSECUTIVE_MISSES = 5
+
+
+class _FrameGrabber:
+    """Daemon thread that keeps the driver queue drained with grab(), which skips decoding.
+
+    Only the newest grabbed frame is decoded, and only when a consumer asks for it, so
+    read() never hands back a frame that queued up while the UI was busy.
+    """
+
+    def __init__(self, camera: Any) -> None:
+        self._camera = camera
+        self._stop = threading.Event()
+        self._wanted = threading.Event()
+        self._ready = threading.Event()
+        self._frame: Any | None = None
+        self._last_frame: Any | None = None
+        self._misses = 0
+        # Guards the hand-off of camera.release() to the grab thread; see stop().
+        self._exit_lock = threading.Lock()
+        self._exited = False
+        self._release_on_exit = False
+        self._thread = threading.Thread(target=self._run, name="sitalarm-preview-grab", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            self._grab_loop()
+        finally:
+            with self._exit_lock:
+                self._exited = True
+                release = self._release_on_exit
+            if release:
+                try:
+                    self._camera.release()
+                except Exception:
+                    pass
+
+    def _grab_loop(self) -> None:
+        camera = self._camera
+        while not self._stop.is_set():
+            try:
+                grabbed = camera.grab()
+            except Exception:
+                grabbed = False
+            if not grabbed:
+                self._stop.wait(0.01)
+                continue
+            if self._wanted.is_set():
+                try:
+                    ok, frame = camera.retrieve()
+                except Exception:
+                    ok, frame = False, None
+                self._frame = frame if ok else None
+                self._wanted.clear()
+                self._ready.set()
+
+    def read(self) -> Any | None:
+        """Newest frame; None once the camera has failed for several reads in a row."""
+        timeout = _READ_TIMEOUT_SECONDS if self._last_frame is not None else _FIRST_FRAME_TIMEOUT_SECONDS
+        self._ready.clear()
+        self._wanted.set()
+        frame = self._frame if self._ready.wait(timeout) else None
+        if frame is None:
+            self._wanted.clear()
+            self._misses += 1
+            if self._last_frame is None or self._misses >= _MAX_CONSECUTIVE_MISSES:
+                return None
+            # A single slow grab is not a camera failure; repeat the previous frame.
+            return self._last_frame
+        self._misses = 0
+        self._last_frame = frame
+        return frame
+
+    def stop(self) -> bool:
+        """Stop grabbing; True when the caller may release the camera.
+
+        If grab() is still blocked in the driver after the join timeout, releasing the
+        capture from here would race it, so the grab thread releases it when it returns.
+        """
+        self._stop.set()
+        self._thread.join(timeout=_READ_TIMEOUT_SECONDS)
+        with self._exit_lock:
+            if self._exited:
+                return True
+            self._release_on_exit = True
+            return False
+
+
+def _release_capture(grabber: _FrameGrabber | None, camera: Any) -> None:
+    """Finalizer target: stop the grabber, then release the capture, ignoring errors.
+
+    Kept at module level so weakref.finalize does not hold a reference to the service.
+    """
+    try:
+        if grabber is None or grabber.stop():
+            camera.release()
+    except Exception:
+        pass
 
 
 class LivePreviewService:
@@ -10,6 +125,14 @@ class LivePreviewService:
         self.camera_index = camera_index
         self._camera_backend = camera_backend
         self._camera: Any | None = None
+        self._grabber: _FrameGrabber | None = None
+        self._finalizer: weakref.finalize | None = None
+        # Reused overlay target; see draw_pose_overlay.
+        self._overlay_buf: Any = None
+        # One-slot cache: the detector hands over the same connections tuple every frame.
+        self._skeleton_source: object = None
+        self._skeleton_pairs: list[tuple[int, int]] = []
+        self._skeleton_array: Any = None
 
     @property
     def started(self) -> bool:
@@ -25,13 +148,29 @@ class LivePreviewService:
             camera.release()
             raise CaptureError("无法打开摄像头，请检查权限或占用情况。")
 
+        configure_low_latency(camera, backend)
         self._camera = camera
+        if callable(getattr(camera, "grab", None)) and callable(getattr(camera, "retrieve", None)):
+            self._grabber = _FrameGrabber(camera)
+        # Releases the camera if the service is dropped without stop().
+        self._finalizer = weakref.finalize(self, _release_capture, self._grabber, camera)
+
+    def __enter__(self) -> LivePreviewService:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
 
     def read_frame(self) -> Any:
         if self._camera is None:
             raise CaptureError("实时预览未启动，请先启动后再读取画面。")
 
-        ok, frame = self._camera.read()
+        if self._grabber is not None:
+            frame = self._grabber.read()
+            ok = frame is not None
+        else:
+            ok, frame = self._camera.read()
         if not ok or frame is None:
             raise CaptureError("实时预览读取失败，请检查摄像头状态。")
         return frame
@@ -44,53 +183,99 @@ class LivePreviewService:
         *,
         status: str,
     ) -> Any:
-        backend = self._resolve_camera_backend()
+        """Return the frame with the pose skeleton drawn on it.
+
+        The result lives in a buffer that is overwritten by the next call, so callers must
+        copy it if they keep it beyond the current frame (the debug tab converts it to a
+        QImage right away, or copies it when a throttled update is deferred).
+        """
+        # Resolved once by start(); _resolve_camera_backend only imports cv2 on a cold call.
+        backend = self._camera_backend or self._resolve_camera_backend()
         if not hasattr(frame, "copy"):
             return frame
 
         points = self._normalize_landmarks(landmarks)
-        if not points:
+        visible_ids = [idx for idx, point in enumerate(points) if point[2] >= _MIN_VISIBILITY]
+        if not visible_ids:
+            # Nothing would be drawn, so skip the full-frame copy.
             return frame
 
-        skeleton = self._normalize_connections(connections)
-        annotated = frame.copy()
+        skeleton = self._skeleton_for(connections)
+        annotated = self._overlay_target(frame)
         line_color = self._status_color(status)
+        line_type = backend.LINE_AA
 
-        for start_idx, end_idx in skeleton:
-            if start_idx >= len(points) or end_idx >= len(points):
-                continue
-            start = points[start_idx]
-            end = points[end_idx]
-            if start[2] < 0.35 or end[2] < 0.35:
-                continue
-            backend.line(
-                annotated,
-                (start[0], start[1]),
-                (end[0], end[1]),
-                line_color,
-                2,
-                backend.LINE_AA,
-            )
-
-        for idx, (x, y, visibility) in enumerate(points):
-            if visibility < 0.35:
-                continue
-            radius = 4 if idx in {0, 7, 8, 11, 12, 23, 24} else 2
-            backend.circle(annotated, (x, y), radius, (255, 255, 255), -1, backend.LINE_AA)
-            backend.circle(annotated, (x, y), radius + 1, line_color, 1, backend.LINE_AA)
+        if np is not None:
+            self._draw_skeleton_batched(backend, annotated, points, self._skeleton_array, line_color)
+        else:
+            for start_idx, end_idx in skeleton:
+                if start_idx >= len(points) or end_idx >= len(points):
+                    continue
+                start = points[start_idx]
+                end = points[end_idx]
+                if start[2] < _MIN_VISIBILITY or end[2] < _MIN_VISIBILITY:
+                    continue
+                backend.line(annotated, (start[0], start[1]), (end[0], end[1]), line_color, 2, line_type)
+
+        circle = backend.circle
+        for idx in visible_ids:
+            x, y, _ = points[idx]
+            radius = 4 if idx in _KEY_POINT_IDS else 2
+            circle(annotated, (x, y), radius, (255, 255, 255), -1, line_type)
+            circle(annotated, (x, y), radius + 1, line_color, 1, line_type)
 
         return annotated
 
+    def _overlay_target(self, frame: Any) -> Any:
+        """Copy frame into the resident overlay buffer, reallocating only on shape/dtype change."""
+        if np is None or not isinstance(frame, np.ndarray):
+            return frame.copy()
+        buf = self._overlay_buf
+        if buf is None or buf.shape != frame.shape or buf.dtype != frame.dtype:
+            buf = self._overlay_buf = np.empty_like(frame)
+        np.copyto(buf, frame)
+        return buf
+
+    def _skeleton_for(self, connections: object) -> list[tuple[int, int]]:
+        """Normalized connection pairs, rebuilt only when a different connections object arrives."""
+        if connections is not self._skeleton_source:
+            pairs = self._normalize_connections(connections)
+            self._skeleton_source = connections
+            self._skeleton_pairs = pairs
+            self._skeleton_array = np.asarray(pairs, dtype=np.int64).reshape(-1, 2) if np is not None else None
+        return self._skeleton_pairs
+
+    @staticmethod
+    def _draw_skeleton_batched(
+        backend: Any,
+        annotated: Any,
+        points: list[tuple[int, int, float]],
+        skeleton: Any,
+        line_color: tuple[int, int, int],
+    ) -> None:
+        """Draw every visible bone with one polylines call."""
+        packed = np.asarray(points, dtype=np.float64)
+        xy = packed[:, :2].astype(np.int32)
+        visible = packed[:, 2] >= _MIN_VISIBILITY
+
+        if len(skeleton):
+            pairs = skeleton[(skeleton < len(points)).all(axis=1)]
+            pairs = pairs[visible[pairs[:, 0]] & visible[pairs[:, 1]]]
+            if len(pairs):
+                # (M, 2, 2): each bone is an open two-point contour.
+                segments = xy[pairs]
+                backend.polylines(annotated, list(segments), False, line_color, 2, backend.LINE_AA)
+
     def stop(self) -> None:
         if self._camera is None:
             return
 
-        try:
-            self._camera.release()
-        except Exception:
-            pass
-        finally:
-            self._camera = None
+        # Calling the finalizer runs _release_capture now and detaches it.
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._grabber = None
+        self._camera = None
 
     def _resolve_camera_backend(self) -> Any:
         if self._camera_backend is not None:
@@ -144,13 +329,3 @@ class LivePreviewService:
         if status == "correct":
             return (0, 138, 255)
         return (156, 163, 175)
-
-    def __del__(self):
-        """析构函数，确保摄像头资源被释放"""
-        try:
-            if self._camera is not None:
-                self._camera.release()
-        except Exception:
-            pass
-        finally:
-            self._camera = None
@@ -1,17 +1,35 @@
 ﻿from __future__ import annotations
 
+import functools
+import hashlib
 import os
+import shutil
 from pathlib import Path
-from urllib.request import urlretrieve
+from urllib.error import ContentTooShortError, HTTPError
+from urllib.request import Request, urlopen
 
 
 # MediaPipe Tasks model hosting (public).
 POSE_LANDMARKER_LITE_URL = (
     "https://storage.googleapis.com/mediapipe-models/pose_landmarker/pose_landmarker_lite/float16/1/pose_landmarker_lite.task"
 )
+# All variants are the FP16 builds; lite is the default (fewest MACs, enough for seated posture).
+POSE_LANDMARKER_URLS = {
+    "lite": POSE_LANDMARKER_LITE_URL,
+    "full": "https://storage.googleapis.com/mediapipe-models/pose_landmarker/pose_landmarker_full/float16/1/pose_landmarker_full.task",
+    "heavy": "https://storage.googleapis.com/mediapipe-models/pose_landmarker/pose_landmarker_heavy/float16/1/pose_landmarker_heavy.task",
+}
 FACE_DETECTOR_SHORT_URL = (
     "https://storage.googleapis.com/mediapipe-models/face_detector/blaze_face_short_range/float16/1/blaze_face_short_range.tflite"
 )
+# Optional SHA-256 pins per model URL; a listed URL is only renamed into place when its
+# download matches. No URL is pinned yet, so downloads are checked for completeness
+# (byte count against the server's length) but not for content. A pin must be the
+# `sha256sum` of the file served at that exact URL; the /1/ segment keeps it stable.
+MODEL_SHA256: dict[str, str] = {}
+
+_DOWNLOAD_CHUNK_BYTES = 64 * 1024
+_DOWNLOAD_TIMEOUT_SECONDS = 30
 
 
 def get_models_dir() -> Path:
@@ -23,9 +41,13 @@ def get_models_dir() -> Path:
 
 
 def ensure_pose_landmarker_model() -> Path:
+    # SITALARM_POSE_LANDMARKER=lite|full|heavy picks the Tasks model variant.
+    variant = os.environ.get("SITALARM_POSE_LANDMARKER", "lite").strip().lower()
+    if variant not in POSE_LANDMARKER_URLS:
+        variant = "lite"
     return _ensure_model_file(
-        relative_path=Path("mediapipe") / "pose_landmarker_lite.task",
-        url=POSE_LANDMARKER_LITE_URL,
+        relative_path=Path("mediapipe") / f"pose_landmarker_{variant}.task",
+        url=POSE_LANDMARKER_URLS[variant],
     )
 
 
@@ -36,19 +58,134 @@ def ensure_face_detector_model() -> Path:
     )
 
 
+def find_face_detector_onnx_model() -> Path | None:
+    """Locate a user-provided BlazeFace ONNX export (e.g. int8-quantized).
+
+    There is no public hosting for it, so it is never downloaded.
+    """
+    override = os.environ.get("SITALARM_FACE_ONNX_MODEL")
+    candidate = Path(override).expanduser() if override else get_models_dir() / "onnx" / "blazeface_int8.onnx"
+    if candidate.exists() and candidate.stat().st_size > 0:
+        return candidate
+    return None
+
+
 def _ensure_model_file(*, relative_path: Path, url: str) -> Path:
-    target = get_models_dir() / relative_path
+    # Cached per target so rebuilding a detector (e.g. on a settings change) does not stat
+    # the models dir again. SITALARM_FORCE_MODEL_RECHECK=1 re-checks, e.g. after deleting a file.
+    if os.environ.get("SITALARM_FORCE_MODEL_RECHECK") == "1":
+        _ensure_model_at.cache_clear()
+    return _ensure_model_at(get_models_dir() / relative_path, url)
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_model_at(target: Path, url: str) -> Path:
     if target.exists() and target.stat().st_size > 0:
         return target
 
     target.parent.mkdir(parents=True, exist_ok=True)
     tmp = target.with_suffix(target.suffix + ".tmp")
 
-    # urlretrieve is stdlib, no extra deps.
-    urlretrieve(url, tmp)  # nosec - controlled URLs
+    _download_resumable(url, tmp)
+
+    expected = MODEL_SHA256.get(url)
+    if expected is not None and _sha256_of(tmp) != expected.lower():
+        _discard_partial(tmp)
+        raise RuntimeError(f"Checksum mismatch for downloaded model {target.name}")
 
     # Atomic-ish replace on Windows.
     if target.exists():
         target.unlink()
     tmp.replace(target)
+    _validator_path(tmp).unlink(missing_ok=True)
     return target
+
+
+def _download_resumable(url: str, tmp: Path) -> None:
+    """Download url into tmp, continuing from a partial tmp left by an interrupted run.
+
+    The partial file is kept on failure so the next attempt only fetches the rest.
+    Raises ContentTooShortError when the body ends before the advertised length.
+    """
+    offset = tmp.stat().st_size if tmp.exists() else 0
+    validator_file = _validator_path(tmp)
+    validator = validator_file.read_text(encoding="utf-8").strip() if validator_file.exists() else ""
+    if offset and not validator:
+        # Nothing proves the partial file came from the current remote file.
+        _discard_partial(tmp)
+        offset = 0
+
+    headers = {"Range": f"bytes={offset}-", "If-Range": validator} if offset else {}
+    request = Request(url, headers=headers)
+    try:
+        response = urlopen(request, timeout=_DOWNLOAD_TIMEOUT_SECONDS)  # nosec - controlled URLs
+    except HTTPError as exc:
+        # 416: the partial file may already hold every byte (a previous run stopped before the rename).
+        if offset and exc.code == 416:
+            if _content_range_total(exc.headers.get("Content-Range")) == offset:
+                return
+            _discard_partial(tmp)
+            return _download_resumable(url, tmp)
+        raise
+
+    with response:
+        # 206 continues the partial file; 200 means the server ignored Range or If-Range
+        # found the remote file changed, so start over.
+        if offset and response.status == 206:
+            content_range = response.headers.get("Content-Range", "")
+            if not content_range.startswith(f"bytes {offset}-"):
+                _discard_partial(tmp)
+                raise ContentTooShortError(f"Unexpected Content-Range {content_range!r} for {url}", None)
+            expected = _content_range_total(content_range)
+            mode = "ab"
+        else:
+            offset = 0
+            expected = _int_or_none(response.headers.get("Content-Length"))
+            mode = "wb"
+            validator_file.write_text(_range_validator(response.headers), encoding="utf-8")
+
+        with open(tmp, mode) as handle:
+            shutil.copyfileobj(response, handle, _DOWNLOAD_CHUNK_BYTES)
+
+    size = tmp.stat().st_size
+    if expected is not None and size != expected:
+        raise ContentTooShortError(f"Downloaded {size} of {expected} bytes from {url}", None)
+
+
+def _range_validator(headers: object) -> str:
+    # If-Range needs a strong ETag; fall back to Last-Modified otherwise.
+    etag = headers.get("ETag") or ""  # type: ignore[attr-defined]
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified") or ""  # type: ignore[attr-defined]
+
+
+def _content_range_total(value: str | None) -> int | None:
+    # "bytes 100-199/200" or "bytes */200"; "*" means the total is unknown.
+    if not value or "/" not in value:
+        return None
+    return _int_or_none(value.rsplit("/", 1)[1])
+
+
+def _int_or_none(value: str | None) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _validator_path(tmp: Path) -> Path:
+    return tmp.with_name(tmp.name + ".validator")
+
+
+def _discard_partial(tmp: Path) -> None:
+    tmp.unlink(missing_ok=True)
+    _validator_path(tmp).unlink(missing_ok=True)
+
+
+def _sha256_of(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_DOWNLOAD_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
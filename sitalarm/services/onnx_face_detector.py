@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+# BlazeFace short-range SSD layout: 128x128 input, strides 8/16/16/16,
+# 2 anchors per cell on the first layer and 6 per cell on the merged stride-16 layers.
+_INPUT_SIZE = 128
+_ANCHOR_LAYOUT = ((16, 2), (8, 6))
+_NMS_IOU_THRESHOLD = 0.3
+
+# Preferred execution providers; int8 kernels are fastest on the OpenVINO / oneDNN EPs.
+_PREFERRED_PROVIDERS = (
+    "OpenVINOExecutionProvider",
+    "DnnlExecutionProvider",
+    "CPUExecutionProvider",
+)
+
+RelativeBox = tuple[float, float, float, float]
+
+
+class OnnxBlazeFaceSession:
+    """BlazeFace (short range) exported to ONNX and run with ONNX Runtime.
+
+    detect() takes an RGB uint8 image and returns boxes as (xmin, ymin, width, height)
+    relative to that image, like MediaPipe's relative_bounding_box.
+    Raises RuntimeError on init when onnxruntime/numpy are missing or the model cannot load.
+    """
+
+    def __init__(self, model_path: Path, min_detection_confidence: float = 0.5) -> None:
+        try:
+            import numpy as np  # type: ignore
+            import onnxruntime as ort  # type: ignore
+        except ImportError as exc:
+            raise RuntimeError(f"onnxruntime unavailable: {exc}") from exc
+
+        self._np = np
+        available = set(ort.get_available_providers())
+        providers = [name for name in _PREFERRED_PROVIDERS if name in available] or None
+        try:
+            self._session = ort.InferenceSession(str(model_path), providers=providers)
+        except Exception as exc:
+            raise RuntimeError(f"failed to load {model_path}: {exc}") from exc
+
+        model_input = self._session.get_inputs()[0]
+        self._input_name = model_input.name
+        # Exports differ in layout; NCHW models have channels in dim 1.
+        self._channels_first = len(model_input.shape) == 4 and model_input.shape[1] == 3
+        self._providers = tuple(self._session.get_providers())
+        self._min_score = float(min_detection_confidence)
+        self._anchors = self._build_anchors()
+        self._input = np.zeros((_INPUT_SIZE, _INPUT_SIZE, 3), dtype=np.float32)
+
+    @property
+    def providers(self) -> tuple[str, ...]:
+        return self._providers
+
+    def _build_anchors(self) -> Any:
+        np = self._np
+        anchors: list[tuple[float, float]] = []
+        for grid, per_cell in _ANCHOR_LAYOUT:
+            for y in range(grid):
+                for x in range(grid):
+                    center = ((x + 0.5) / grid, (y + 0.5) / grid)
+                    anchors.extend([center] * per_cell)
+        return np.asarray(anchors, dtype=np.float32)
+
+    def detect(self, rgb: Any) -> list[RelativeBox]:
+        import cv2  # type: ignore
+
+        np = self._np
+        height, width = rgb.shape[:2]
+        if width <= 0 or height <= 0:
+            return []
+
+        # Letterbox into the square input the same way MediaPipe's FIT scale mode does.
+        scale = _INPUT_SIZE / max(width, height)
+        resized_w = max(1, int(round(width * scale)))
+        resized_h = max(1, int(round(height * scale)))
+        pad_x = (_INPUT_SIZE - resized_w) // 2
+        pad_y = (_INPUT_SIZE - resized_h) // 2
+        resized = cv2.resize(rgb, (resized_w, resized_h))
+
+        self._input.fill(0.0)
+        target = self._input[pad_y:pad_y + resized_h, pad_x:pad_x + resized_w]
+        np.multiply(resized, 1.0 / 127.5, out=target, casting="unsafe")
+        target -= 1.0
+
+        tensor = np.ascontiguousarray(self._input.transpose(2, 0, 1)) if self._channels_first else self._input
+        outputs = self._session.run(None, {self._input_name: tensor[np.newaxis]})
+
+        regressors = scores = None
+        for output in outputs:
+            if output.shape[-1] == 16:
+                regressors = output.reshape(-1, 16)
+            elif output.shape[-1] == 1:
+                scores = output.reshape(-1)
+        if regressors is None or scores is None:
+            return []
+
+        probs = 1.0 / (1.0 + np.exp(-np.clip(scores, -100.0, 100.0)))
+        keep = np.nonzero(probs >= self._min_score)[0]
+        if keep.size == 0:
+            return []
+
+        anchors = self._anchors[keep]
+        raw = regressors[keep, :4] / _INPUT_SIZE
+        centers = raw[:, :2] + anchors
+        sizes = raw[:, 2:4]
+        mins = centers - sizes / 2.0
+
+        candidates = sorted(
+            zip(probs[keep].tolist(), mins.tolist(), sizes.tolist()),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        selected: list[tuple[float, float, float, float]] = []
+        for _, (xmin, ymin), (box_w, box_h) in candidates:
+            box = (xmin, ymin, box_w, box_h)
+            if all(_iou(box, other) < _NMS_IOU_THRESHOLD for other in selected):
+                selected.append(box)
+
+        # Undo the letterbox so boxes are relative to the caller's image.
+        sx = _INPUT_SIZE / resized_w
+        sy = _INPUT_SIZE / resized_h
+        ox = pad_x / _INPUT_SIZE
+        oy = pad_y / _INPUT_SIZE
+        return [
+            ((xmin - ox) * sx, (ymin - oy) * sy, box_w * sx, box_h * sy)
+            for xmin, ymin, box_w, box_h in selected
+        ]
+
+
+def _iou(a: RelativeBox, b: RelativeBox) -> float:
+    ax2, ay2 = a[0] + a[2], a[1] + a[3]
+    bx2, by2 = b[0] + b[2], b[1] + b[3]
+    inter_w = min(ax2, bx2) - max(a[0], b[0])
+    inter_h = min(ay2, by2) - max(a[1], b[1])
+    if inter_w <= 0 or inter_h <= 0:
+        return 0.0
+    inter = inter_w * inter_h
+    union = a[2] * a[3] + b[2] * b[3] - inter
+    return inter / union if union > 0 else 0.0
@@ -3,6 +3,38 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - runtime dependency
+    np = None
+
+# MediaPipe pose landmark indices.
+_LEFT_EAR = 7
+_RIGHT_EAR = 8
+_LEFT_SHOULDER = 11
+_RIGHT_SHOULDER = 12
+_LEFT_HIP = 23
+_RIGHT_HIP = 24
+_EARS = [_LEFT_EAR, _RIGHT_EAR]
+_SHOULDERS = [_LEFT_SHOULDER, _RIGHT_SHOULDER]
+_HIPS = [_LEFT_HIP, _RIGHT_HIP]
+_UPPER_BODY = [_LEFT_SHOULDER, _RIGHT_SHOULDER, _LEFT_EAR, _RIGHT_EAR]
+# Reason tuples for every combination of the three rule bits, in the order they were
+# always reported: head_forward (1), shrugging (2), hunchback (4).
+_REASONS_BY_MASK: tuple[tuple[str, ...], ...] = (
+    (),
+    ("head_forward",),
+    ("shrugging",),
+    ("head_forward", "shrugging"),
+    ("hunchback",),
+    ("head_forward", "hunchback"),
+    ("shrugging", "hunchback"),
+    ("head_forward", "shrugging", "hunchback"),
+)
+# Frames are shrunk to this short side before inference; the pose model runs at ~256 px
+# internally and landmarks are normalized, so the metrics do not change.
+_INFER_SHORT_SIDE = 480
+
 
 @dataclass(frozen=True)
 class PoseMetrics:
@@ -13,12 +45,38 @@ class PoseMetrics:
     trunk_available: bool = True
 
 
+@dataclass(frozen=True)
+class PostureDebugInfo:
+    """Raw metrics behind a MediaPipePostureDetector result; formatting is left to the UI.
+
+    Thresholds are not repeated here; they live on RuleBasedPostureClassifier.
+    """
+
+    __slots__ = (
+        "upper_visibility",
+        "hip_visibility",
+        "head_forward_ratio",
+        "shoulder_raise_ratio",
+        "trunk_lean_degrees",
+        "trunk_available",
+    )
+
+    upper_visibility: float
+    hip_visibility: float
+    head_forward_ratio: float
+    shoulder_raise_ratio: float
+    trunk_lean_degrees: float
+    trunk_available: bool
+
+
 @dataclass(frozen=True)
 class PostureResult:
     status: str
     reasons: tuple[str, ...]
     confidence: float | None
-    debug_info: dict[str, object] | None = None
+    # The head-ratio pipeline attaches a dict for the dashboard/debug tab;
+    # MediaPipePostureDetector attaches PostureDebugInfo.
+    debug_info: dict[str, object] | PostureDebugInfo | None = None
 
 
 class RuleBasedPostureClassifier:
@@ -38,24 +96,27 @@ class RuleBasedPostureClassifier:
         if metrics.visibility < self.min_visibility:
             return PostureResult(status="unknown", reasons=(), confidence=metrics.visibility)
 
-        reasons: list[str] = []
-        if metrics.head_forward_ratio >= self.head_forward_threshold:
-            reasons.append("head_forward")
-        if metrics.shoulder_raise_ratio >= self.shoulder_raise_threshold:
-            reasons.append("shrugging")
-        if metrics.trunk_available and metrics.trunk_lean_degrees >= self.trunk_lean_threshold:
-            reasons.append("hunchback")
+        mask = (
+            (metrics.head_forward_ratio >= self.head_forward_threshold)
+            | (metrics.shoulder_raise_ratio >= self.shoulder_raise_threshold) << 1
+            | (metrics.trunk_available and metrics.trunk_lean_degrees >= self.trunk_lean_threshold) << 2
+        )
+        reasons = _REASONS_BY_MASK[mask]
 
         status = "incorrect" if reasons else "correct"
         confidence = min(1.0, max(0.0, metrics.visibility))
-        return PostureResult(status=status, reasons=tuple(reasons), confidence=confidence)
+        return PostureResult(status=status, reasons=reasons, confidence=confidence)
 
 
 class MediaPipePostureDetector:
     """Pose detection wrapper. Falls back to unknown if mediapipe is missing."""
 
-    def __init__(self, classifier: RuleBasedPostureClassifier | None = None) -> None:
+    def __init__(self, classifier: RuleBasedPostureClassifier | None = None, debug: bool = False) -> None:
         self.classifier = classifier or RuleBasedPostureClassifier()
+        # debug_info (PostureDebugInfo) is only built when enabled.
+        self.debug = debug
+        # Reused RGB scratch buffer; reallocated only when the frame shape changes.
+        self._rgb_buf: Any = None
         try:
             import cv2  # type: ignore
             import mediapipe as mp  # type: ignore
@@ -67,9 +128,18 @@ class MediaPipePostureDetector:
 
         self._cv2 = cv2
         self._mp = mp
+        # Bound once; detect() runs per frame.
+        self._cvt_color = cv2.cvtColor
+        self._bgr2rgb = cv2.COLOR_BGR2RGB
+        self._resize = cv2.resize
+        self._inter_area = cv2.INTER_AREA
         try:
+            # Video mode tracks between frames instead of running the person detector
+            # on every call; the lite model is enough for the coarse rules below.
             self._pose = mp.solutions.pose.Pose(
-                static_image_mode=True,
+                static_image_mode=False,
+                model_complexity=0,
+                smooth_landmarks=True,
                 min_detection_confidence=0.5,
                 min_tracking_confidence=0.5,
             )
@@ -81,49 +151,39 @@ class MediaPipePostureDetector:
         if self._pose is None or self._cv2 is None or self._mp is None:
             return PostureResult(status="unknown", reasons=(), confidence=None)
 
-        rgb = self._cv2.cvtColor(frame, self._cv2.COLOR_BGR2RGB)
+        height, width = frame.shape[:2]
+        short_side = min(height, width)
+        if short_side > _INFER_SHORT_SIDE:
+            scale = _INFER_SHORT_SIDE / short_side
+            frame = self._resize(
+                frame,
+                (max(1, int(width * scale)), max(1, int(height * scale))),
+                interpolation=self._inter_area,
+            )
+
+        rgb = self._rgb_buf
+        if rgb is None or rgb.shape != frame.shape or rgb.dtype != frame.dtype:
+            rgb = self._rgb_buf = frame.copy()
+        rgb.flags.writeable = True
+        self._cvt_color(frame, self._bgr2rgb, dst=rgb)
+        # Read-only input lets MediaPipe wrap the buffer instead of copying it.
+        rgb.flags.writeable = False
         result = self._pose.process(rgb)
         if not result.pose_landmarks:
             return PostureResult(status="unknown", reasons=(), confidence=0.0)
 
-        lm = result.pose_landmarks.landmark
-        mp_pose = self._mp.solutions.pose.PoseLandmark
-
-        def mean_visibility(*indices: int) -> float:
-            values = [lm[index].visibility for index in indices]
-            return sum(values) / len(values)
-
-        left_shoulder = lm[mp_pose.LEFT_SHOULDER]
-        right_shoulder = lm[mp_pose.RIGHT_SHOULDER]
-        left_ear = lm[mp_pose.LEFT_EAR]
-        right_ear = lm[mp_pose.RIGHT_EAR]
-        left_hip = lm[mp_pose.LEFT_HIP]
-        right_hip = lm[mp_pose.RIGHT_HIP]
-
-        shoulder_width = abs(left_shoulder.x - right_shoulder.x) + 1e-6
-        ear_to_shoulder = (
-            abs(left_ear.x - left_shoulder.x) + abs(right_ear.x - right_shoulder.x)
-        ) / 2.0
-        head_forward_ratio = ear_to_shoulder / shoulder_width
-
-        shoulder_raise_ratio = (
-            abs(left_shoulder.y - left_ear.y) + abs(right_shoulder.y - right_ear.y)
-        ) / 2.0
-
-        upper_visibility = mean_visibility(
-            mp_pose.LEFT_SHOULDER,
-            mp_pose.RIGHT_SHOULDER,
-            mp_pose.LEFT_EAR,
-            mp_pose.RIGHT_EAR,
-        )
-        hip_visibility = mean_visibility(mp_pose.LEFT_HIP, mp_pose.RIGHT_HIP)
+        (
+            head_forward_ratio,
+            shoulder_raise_ratio,
+            upper_visibility,
+            hip_visibility,
+            trunk_rise,
+        ) = self._measure(result.pose_landmarks.landmark)
         trunk_available = hip_visibility >= 0.2
 
         trunk_lean_degrees = 0.0
         if trunk_available:
-            shoulder_mid_y = (left_shoulder.y + right_shoulder.y) / 2.0
-            hip_mid_y = (left_hip.y + right_hip.y) / 2.0
-            trunk_lean_degrees = max(0.0, (0.35 - (hip_mid_y - shoulder_mid_y)) * 100.0)
+            trunk_lean_degrees = max(0.0, (0.35 - trunk_rise) * 100.0)
 
         metrics = PoseMetrics(
             visibility=upper_visibility,
@@ -133,21 +193,65 @@ class MediaPipePostureDetector:
             trunk_available=trunk_available,
         )
         result = self.classifier.classify(metrics)
-        debug_info = {
-            "upper_visibility": round(upper_visibility, 4),
-            "hip_visibility": round(hip_visibility, 4),
-            "head_forward_ratio": round(head_forward_ratio, 4),
-            "shoulder_raise_ratio": round(shoulder_raise_ratio, 4),
-            "trunk_lean_degrees": round(trunk_lean_degrees, 4),
-            "trunk_available": trunk_available,
-            "threshold_visibility": self.classifier.min_visibility,
-            "threshold_head_forward": self.classifier.head_forward_threshold,
-            "threshold_shrugging": self.classifier.shoulder_raise_threshold,
-            "threshold_hunchback": self.classifier.trunk_lean_threshold,
-        }
+        if not self.debug:
+            return result
+
+        debug_info = PostureDebugInfo(
+            upper_visibility=upper_visibility,
+            hip_visibility=hip_visibility,
+            head_forward_ratio=head_forward_ratio,
+            shoulder_raise_ratio=shoulder_raise_ratio,
+            trunk_lean_degrees=trunk_lean_degrees,
+            trunk_available=trunk_available,
+        )
         return PostureResult(
             status=result.status,
             reasons=result.reasons,
             confidence=result.confidence,
             debug_info=debug_info,
         )
+
+    @staticmethod
+    def _measure(lm: Any) -> tuple[float, float, float, float, float]:
+        """Head-forward ratio, shoulder raise, upper/hip visibility and hip-to-shoulder rise."""
+        if np is not None:
+            # One (33, 4) gather of x, y, z, visibility, then a few small vector ops.
+            packed = np.fromiter(
+                (value for point in lm for value in (point.x, point.y, point.z, point.visibility)),
+                dtype=np.float64,
+                count=len(lm) * 4,
+            ).reshape(-1, 4)
+            ear_to_shoulder = np.abs(packed[_EARS, :2] - packed[_SHOULDERS, :2]).mean(axis=0)
+            shoulder_width = abs(packed[_LEFT_SHOULDER, 0] - packed[_RIGHT_SHOULDER, 0]) + 1e-6
+            return (
+                float(ear_to_shoulder[0] / shoulder_width),
+                float(ear_to_shoulder[1]),
+                float(packed[_UPPER_BODY, 3].mean()),
+                float(packed[_HIPS, 3].mean()),
+                float(packed[_HIPS, 1].mean() - packed[_SHOULDERS, 1].mean()),
+            )
+
+        left_shoulder = lm[_LEFT_SHOULDER]
+        right_shoulder = lm[_RIGHT_SHOULDER]
+        left_ear = lm[_LEFT_EAR]
+        right_ear = lm[_RIGHT_EAR]
+        left_hip = lm[_LEFT_HIP]
+        right_hip = lm[_RIGHT_HIP]
+
+        shoulder_width = abs(left_shoulder.x - right_shoulder.x) + 1e-6
+        ear_to_shoulder = (
+            abs(left_ear.x - left_shoulder.x) + abs(right_ear.x - right_shoulder.x)
+        ) / 2.0
+        shoulder_raise_ratio = (
+            abs(left_shoulder.y - left_ear.y) + abs(right_shoulder.y - right_ear.y)
+        ) / 2.0
+        upper_visibility = sum(lm[index].visibility for index in _UPPER_BODY) / len(_UPPER_BODY)
+        hip_visibility = (left_hip.visibility + right_hip.visibility) / 2.0
+        trunk_rise = (left_hip.y + right_hip.y) / 2.0 - (left_shoulder.y + right_shoulder.y) / 2.0
+        return (
+            ear_to_shoulder / shoulder_width,
+            shoulder_raise_ratio,
+            upper_visibility,
+            hip_visibility,
+            trunk_rise,
+        )
@@ -23,16 +23,19 @@ class ReminderPolicy:
         if not reasons:
             return False
 
-        due = False
+        cooldown = self.cooldown
+        last_sent = self._last_sent
+        # Any due reason fires the reminder, so stop at the first one.
         for reason in reasons:
-            last = self._last_sent.get(reason)
-            if last is None or (now - last) >= self.cooldown:
-                due = True
-
-        if due:
-            for reason in reasons:
-                self._last_sent[reason] = now
-        return due
+            last = last_sent.get(reason)
+            if last is None or (now - last) >= cooldown:
+                break
+        else:
+            return False
+
+        for reason in reasons:
+            last_sent[reason] = now
+        return True
 
     def build_message(self, reasons: list[str] | tuple[str, ...]) -> str:
         if not reasons:
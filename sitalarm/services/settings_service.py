@@ -1,17 +1,47 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+from dataclasses import asdict, replace
+from typing import Callable
 
 from sitalarm.config import AppSettings, DEFAULT_SETTINGS
 from sitalarm.services.storage import Storage
 
 
+def _parse_bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+def _coercer_for(default: object) -> Callable[[str], object]:
+    # bool first: it is a subclass of int.
+    if isinstance(default, bool):
+        return _parse_bool
+    if isinstance(default, int):
+        return int
+    if isinstance(default, float):
+        return float
+    return str
+
+
+# Built once at import: the default field values and a parser per stored (string) value.
+_DEFAULT_DATA: dict[str, object] = asdict(DEFAULT_SETTINGS)
+_COERCERS: dict[str, Callable[[str], object]] = {
+    key: _coercer_for(value) for key, value in _DEFAULT_DATA.items()
+}
+
+
 class SettingsService:
     def __init__(self, storage: Storage) -> None:
         self.storage = storage
+        # (storage settings_version, parsed settings); dropped whenever the store changes.
+        self._cache: tuple[int, AppSettings] | None = None
 
     def load(self) -> AppSettings:
-        data = asdict(DEFAULT_SETTINGS)
+        version = self.storage.settings_version
+        cache = self._cache
+        if cache is not None and cache[0] == version:
+            return cache[1]
+
+        data = dict(_DEFAULT_DATA)
         stored = self.storage.all_settings()
 
         # Backward compatibility: migrate old minutes-based interval to seconds.
@@ -25,32 +55,21 @@ class SettingsService:
                     pass
 
         for key, value in stored.items():
-            if key not in data:
-                continue
-            if isinstance(data[key], bool):
-                data[key] = value.lower() == "true"
-            elif isinstance(data[key], int):
-                data[key] = int(value)
-            elif isinstance(data[key], float):
-                data[key] = float(value)
-            else:
-                data[key] = value
+            coerce = _COERCERS.get(key)
+            if coerce is not None:
+                data[key] = coerce(value)
 
         # Normalize legacy/Chinese detection-mode aliases.
         data["detection_mode"] = self._normalize_detection_mode(data.get("detection_mode"))
-        return AppSettings(**data)
+        settings = AppSettings(**data)
+        self._cache = (version, settings)
+        return settings
 
     def update(self, **changes: object) -> AppSettings:
-        current = asdict(self.load())
-        for key, value in changes.items():
-            if key not in current:
-                continue
-            current[key] = value
-
-        normalized = AppSettings(**current)
+        known = {key: value for key, value in changes.items() if key in _DEFAULT_DATA}
+        normalized = replace(self.load(), **known)
         payload = asdict(normalized)
-        for key, value in payload.items():
-            self.storage.set_setting(key, str(value))
+        self.storage.set_settings({key: str(value) for key, value in payload.items()})
         return normalized
 
     @staticmethod
@@ -23,6 +23,13 @@ class PostureRecord:
 
 
 class StatsService:
+    # Which of (correct, incorrect, unknown) a detection interval is credited to.
+    _STATUS_MASK: dict[str, tuple[int, int, int]] = {
+        "correct": (1, 0, 0),
+        "incorrect": (0, 1, 0),
+        "unknown": (0, 0, 1),
+    }
+
     def __init__(self, storage: Storage) -> None:
         self.storage = storage
 
@@ -38,22 +45,22 @@ class StatsService:
 
     def record_detection(self, day: date, status: str, interval_seconds: int) -> None:
         seconds = max(0, int(interval_seconds))
-        correct = seconds if status == "correct" else 0
-        incorrect = seconds if status == "incorrect" else 0
-        unknown = seconds if status == "unknown" else 0
-        self.storage.increment_daily_stats(day, correct, incorrect, unknown)
+        correct, incorrect, unknown = self._STATUS_MASK.get(status, (0, 0, 0))
+        self.storage.increment_daily_stats(day, seconds * correct, seconds * incorrect, seconds * unknown)
 
     def get_day_summary(self, day: date) -> DaySummary:
-        row = self.storage.get_daily_stats(day)
+        snapshot = self.storage.get_day_snapshot(day)
         # Try to get system screen time first, fall back to app-based measurement
         screen_seconds = get_system_screen_time_today()
         if screen_seconds is None or screen_seconds == 0:
-            screen_seconds = self.storage.get_screen_usage_seconds(day)
-        return self._row_to_summary(row, screen_seconds)
+            screen_seconds = snapshot.screen_seconds
+        return self._row_to_summary(snapshot.stats, day, screen_seconds)
 
     def get_last_days(self, days: int, today: date) -> list[DaySummary]:
         rows = self.storage.list_daily_stats(days=days, today=today)
-        return [self._row_to_summary(row, self.storage.get_screen_usage_seconds(date.fromisoformat(row.date))) for row in rows]
+        row_days = [date.fromisoformat(row.date) for row in rows]
+        usage = self.storage.get_screen_usage_seconds_map(row_days)
+        return [self._row_to_summary(row, day, usage.get(day, 0)) for row, day in zip(rows, row_days)]
 
     def get_today_detection_start(self, day: date) -> datetime | None:
         started_at = self.storage.get_detection_start(day)
@@ -69,9 +76,10 @@ class StatsService:
         return [self._row_to_record(row) for row in rows]
 
     @staticmethod
-    def _row_to_summary(row: DailyStatsRow, screen_seconds: int = 0) -> DaySummary:
+    def _row_to_summary(row: DailyStatsRow, day: date, screen_seconds: int = 0) -> DaySummary:
+        # The caller already holds row.date as a date, so it is passed in rather than re-parsed.
         return DaySummary(
-            day=date.fromisoformat(row.date),
+            day=day,
             correct_seconds=row.correct_seconds,
             incorrect_seconds=row.incorrect_seconds,
             unknown_seconds=row.unknown_seconds,
@@ -2,12 +2,71 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from threading import Lock
-from typing import Generator, Iterable
+from threading import Lock, local
+from typing import Generator, Iterable, Mapping
+
+# Hot write statements, kept as constants so every call hands sqlite3 the same string and
+# hits its prepared-statement cache.
+_UPSERT_SETTING_SQL = """
+    INSERT INTO settings(key, value, updated_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        updated_at = excluded.updated_at
+"""
+_INSERT_POSTURE_EVENT_SQL = """
+    INSERT INTO posture_events(captured_at, status, reasons, image_path, confidence)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_INCREMENT_DAILY_STATS_SQL = """
+    INSERT INTO daily_stats(date, correct_seconds, incorrect_seconds, unknown_seconds, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        correct_seconds = correct_seconds + excluded.correct_seconds,
+        incorrect_seconds = incorrect_seconds + excluded.incorrect_seconds,
+        unknown_seconds = unknown_seconds + excluded.unknown_seconds,
+        updated_at = excluded.updated_at
+"""
+# Stored in PRAGMA user_version once migrations up to this version have run.
+_SCHEMA_VERSION = 1
+# posture_events.reasons holds reason codes joined by the ASCII unit separator, which
+# cannot occur in a code name. Rows written by older versions hold a JSON list instead.
+_REASON_SEP = "\x1f"
+# Stats increments are buffered in memory and written in one transaction once this many
+# seconds have passed or this many days are pending (bounds what a crash can lose).
+_STATS_FLUSH_SECONDS = 5.0
+_STATS_FLUSH_MAX_KEYS = 64
+_INCREMENT_SCREEN_USAGE_SQL = """
+    INSERT INTO screen_usage_stats(date, screen_seconds, updated_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        screen_seconds = screen_seconds + excluded.screen_seconds,
+        updated_at = excluded.updated_at
+"""
+# updated_at only needs second resolution, so the formatted UTC timestamp is reused
+# for every write within the same wall-clock second.
+_utc_iso_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    global _utc_iso_cache
+    second = int(time.time())
+    cached_second, cached_iso = _utc_iso_cache
+    if second != cached_second:
+        cached_iso = datetime.fromtimestamp(second, tz=timezone.utc).isoformat()
+        _utc_iso_cache = (second, cached_iso)
+    return cached_iso
+
+
+def _day_bounds(day: date) -> tuple[str, str]:
+    # ISO timestamps sort like the datetimes they encode, so a day is the half-open
+    # string range [that date, the next date).
+    return day.isoformat(), (day + timedelta(days=1)).isoformat()
 
 
 @dataclass
@@ -18,6 +77,17 @@ class DailyStatsRow:
     unknown_seconds: int
 
 
+def _daily_stats_row_factory(cursor: sqlite3.Cursor, row: tuple) -> DailyStatsRow:
+    return DailyStatsRow(*row)
+
+
+@dataclass
+class DaySnapshot:
+    stats: DailyStatsRow
+    screen_seconds: int
+    detection_start: str | None
+
+
 @dataclass
 class PostureEventRow:
     captured_at: str
@@ -30,21 +100,165 @@ class Storage:
     def __init__(self, db_path: Path) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Each thread gets its own connection so WAL readers never queue behind a writer;
+        # SQLite's busy_timeout serializes the writers. _lock only guards in-memory state.
         self._lock = Lock()
+        self._tls = local()
+        self._connections: list[sqlite3.Connection] = []
+        # Bumped on every write to the settings table so readers can cache what they parsed.
+        self._settings_version = 0
+        # day -> [correct, incorrect, unknown] / screen seconds not yet written.
+        self._pending_daily: dict[str, list[int]] = {}
+        self._pending_screen: dict[str, int] = {}
+        self._last_stats_flush = time.monotonic()
         self._init_schema()
 
+    @property
+    def settings_version(self) -> int:
+        return self._settings_version
+
+    def _bump_settings_version(self) -> None:
+        # Called after the write commits so a reader that sees the new version sees the data.
+        with self._lock:
+            self._settings_version += 1
+
+    @staticmethod
+    def _configure_connection(conn: sqlite3.Connection, read_only: bool = False) -> None:
+        conn.executescript(
+            """
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA busy_timeout=30000;
+            PRAGMA mmap_size=268435456;
+            """
+        )
+        if read_only:
+            conn.execute("PRAGMA query_only=1")
+            return
+        # WAL keeps readers and the writer from blocking each other and, with
+        # synchronous=NORMAL, fsyncs on checkpoint instead of on every commit. Note that WAL
+        # keeps -wal/-shm sidecar files next to the database while it is open.
+        try:
+            conn.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;")
+        except sqlite3.DatabaseError:
+            # E.g. WAL is unsupported on some network filesystems; defaults still work.
+            pass
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._tls = local()
+
+    def flush(self) -> None:
+        """Write buffered daily/screen-usage increments now."""
+        with self._connect_with_pending_stats():
+            pass
+
+    @contextmanager
+    def _connect_with_pending_stats(self) -> Generator[sqlite3.Connection, None, None]:
+        """_connect() with the buffered increments written first, so reads see them.
+
+        The buffers are swapped out under _lock and written outside it, so other threads
+        can keep incrementing while this one waits for SQLite's write lock. If the
+        transaction does not commit, the taken increments are merged back.
+        """
+        with self._lock:
+            self._last_stats_flush = time.monotonic()
+            daily, self._pending_daily = self._pending_daily, {}
+            screen, self._pending_screen = self._pending_screen, {}
+        try:
+            with self._connect() as conn:
+                if daily or screen:
+                    now = _utc_now_iso()
+                    if daily:
+                        conn.executemany(
+                            _INCREMENT_DAILY_STATS_SQL,
+                            [(day_key, *deltas, now) for day_key, deltas in daily.items()],
+                        )
+                    if screen:
+                        conn.executemany(
+                            _INCREMENT_SCREEN_USAGE_SQL,
+                            [(day_key, seconds, now) for day_key, seconds in screen.items()],
+                        )
+                yield conn
+        except BaseException:
+            self._restore_pending_stats(daily, screen)
+            raise
+
+    def _restore_pending_stats(self, daily: dict[str, list[int]], screen: dict[str, int]) -> None:
+        with self._lock:
+            for day_key, deltas in daily.items():
+                pending = self._pending_daily.setdefault(day_key, [0, 0, 0])
+                for index, delta in enumerate(deltas):
+                    pending[index] += delta
+            for day_key, seconds in screen.items():
+                self._pending_screen[day_key] = self._pending_screen.get(day_key, 0) + seconds
+
+    @staticmethod
+    def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+        # Plain tuple rows for hot multi-row reads; sqlite3.Row pays a name lookup per column.
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor
+
+    @staticmethod
+    def _daily_stats_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+        # For "SELECT date, correct_seconds, incorrect_seconds, unknown_seconds" queries.
+        # Column types are fixed by the schema (TEXT / INTEGER NOT NULL), so rows are used as-is.
+        cursor = conn.cursor()
+        cursor.row_factory = _daily_stats_row_factory
+        return cursor
+
+    def _stats_flush_due(self) -> bool:
+        return (
+            len(self._pending_daily) + len(self._pending_screen) > _STATS_FLUSH_MAX_KEYS
+            or time.monotonic() - self._last_stats_flush >= _STATS_FLUSH_SECONDS
+        )
+
     @contextmanager
     def _connect(self) -> Generator[sqlite3.Connection, None, None]:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = self._open_connection()
         try:
             yield conn
             conn.commit()
-        finally:
-            conn.close()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    @contextmanager
+    def _read(self) -> Generator[sqlite3.Connection, None, None]:
+        # Read-only methods that don't depend on buffered stats use a second per-thread
+        # connection opened with mode=ro, so they never open a write transaction.
+        conn = getattr(self._tls, "ro_conn", None)
+        if conn is None:
+            conn = self._open_connection(read_only=True)
+        yield conn
+
+    def _open_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        # check_same_thread=False only so close() can close every thread's connection;
+        # otherwise a connection is used solely by the thread that opened it.
+        if read_only:
+            target, uri = f"{self.db_path.resolve().as_uri()}?mode=ro", True
+        else:
+            target, uri = str(self.db_path), False
+        conn = sqlite3.connect(target, check_same_thread=False, cached_statements=256, uri=uri)
+        conn.row_factory = sqlite3.Row
+        self._configure_connection(conn, read_only)
+        if read_only:
+            self._tls.ro_conn = conn
+        else:
+            self._tls.conn = conn
+        with self._lock:
+            self._connections.append(conn)
+        return conn
 
     def _init_schema(self) -> None:
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS settings (
@@ -62,6 +276,10 @@ class Storage:
                     confidence REAL
                 );
 
+                -- Day-range listings and the first-event-of-day lookup seek and order by this.
+                CREATE INDEX IF NOT EXISTS idx_posture_events_captured_at
+                    ON posture_events(captured_at);
+
                 CREATE TABLE IF NOT EXISTS daily_stats (
                     date TEXT PRIMARY KEY,
                     correct_seconds INTEGER NOT NULL DEFAULT 0,
@@ -77,9 +295,11 @@ class Storage:
                 );
                 """
             )
-            # Migration: older versions used *_minutes columns. Keep them if they exist,
-            # but prefer *_seconds going forward.
-            self._migrate_daily_stats_minutes_to_seconds(conn)
+            if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+                # Migration: older versions used *_minutes columns. Keep them if they exist,
+                # but prefer *_seconds going forward.
+                self._migrate_daily_stats_minutes_to_seconds(conn)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
     @staticmethod
     def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
@@ -109,39 +329,39 @@ class Storage:
         )
 
     def list_tables(self) -> set[str]:
-        with self._lock, self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table'"
             ).fetchall()
         return {row["name"] for row in rows}
 
     def get_setting(self, key: str) -> str | None:
-        with self._lock, self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT value FROM settings WHERE key = ?", (key,)
             ).fetchone()
         if row is None:
             return None
-        return str(row["value"])
+        return row["value"]
 
     def set_setting(self, key: str, value: str) -> None:
-        now = datetime.now(timezone.utc).isoformat()
-        with self._lock, self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO settings(key, value, updated_at)
-                VALUES (?, ?, ?)
-                ON CONFLICT(key) DO UPDATE SET
-                    value = excluded.value,
-                    updated_at = excluded.updated_at
-                """,
-                (key, value, now),
-            )
+        now = _utc_now_iso()
+        with self._connect() as conn:
+            conn.execute(_UPSERT_SETTING_SQL, (key, value, now))
+        self._bump_settings_version()
+
+    def set_settings(self, items: Mapping[str, str]) -> None:
+        """Upsert several settings in one transaction."""
+        if not items:
+            return
+        now = _utc_now_iso()
+        with self._connect() as conn:
+            conn.executemany(_UPSERT_SETTING_SQL, [(key, value, now) for key, value in items.items()])
+        self._bump_settings_version()
 
     def all_settings(self) -> dict[str, str]:
-        with self._lock, self._connect() as conn:
-            rows = conn.execute("SELECT key, value FROM settings").fetchall()
-        return {str(row["key"]): str(row["value"]) for row in rows}
+        with self._read() as conn:
+            return dict(self._tuple_cursor(conn).execute("SELECT key, value FROM settings"))
 
     def insert_posture_event(
         self,
@@ -151,16 +371,13 @@ class Storage:
         image_path: Path,
         confidence: float | None,
     ) -> None:
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             conn.execute(
-                """
-                INSERT INTO posture_events(captured_at, status, reasons, image_path, confidence)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+                _INSERT_POSTURE_EVENT_SQL,
                 (
                     captured_at.isoformat(),
                     status,
-                    json.dumps(list(reasons), ensure_ascii=True),
+                    _REASON_SEP.join(reasons),
                     str(image_path),
                     confidence,
                 ),
@@ -173,21 +390,17 @@ class Storage:
         incorrect_delta: int,
         unknown_delta: int,
     ) -> None:
+        if not (correct_delta or incorrect_delta or unknown_delta):
+            return
         day_key = day.isoformat()
-        now = datetime.now(timezone.utc).isoformat()
-        with self._lock, self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO daily_stats(date, correct_seconds, incorrect_seconds, unknown_seconds, updated_at)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(date) DO UPDATE SET
-                    correct_seconds = correct_seconds + excluded.correct_seconds,
-                    incorrect_seconds = incorrect_seconds + excluded.incorrect_seconds,
-                    unknown_seconds = unknown_seconds + excluded.unknown_seconds,
-                    updated_at = excluded.updated_at
-                """,
-                (day_key, correct_delta, incorrect_delta, unknown_delta, now),
-            )
+        with self._lock:
+            pending = self._pending_daily.setdefault(day_key, [0, 0, 0])
+            pending[0] += correct_delta
+            pending[1] += incorrect_delta
+            pending[2] += unknown_delta
+            due = self._stats_flush_due()
+        if due:
+            self.flush()
 
     def get_daily_stats(self, day: date) -> DailyStatsRow:
         row = self._get_daily_stats_row(day.isoformat())
@@ -196,34 +409,23 @@ class Storage:
         return row
 
     def list_daily_stats(self, days: int, today: date) -> list[DailyStatsRow]:
-        start_day = today.fromordinal(today.toordinal() - (days - 1))
-        with self._lock, self._connect() as conn:
-            rows = conn.execute(
+        start_ord = today.toordinal() - (days - 1)
+        day_keys = [date.fromordinal(start_ord + offset).isoformat() for offset in range(days)]
+        if not day_keys:
+            return []
+        with self._connect_with_pending_stats() as conn:
+            rows = self._daily_stats_cursor(conn).execute(
                 """
                 SELECT date, correct_seconds, incorrect_seconds, unknown_seconds
                 FROM daily_stats
                 WHERE date BETWEEN ? AND ?
                 ORDER BY date ASC
                 """,
-                (start_day.isoformat(), today.isoformat()),
+                (day_keys[0], day_keys[-1]),
             ).fetchall()
 
-        by_date = {
-            row["date"]: DailyStatsRow(
-                date=str(row["date"]),
-                correct_seconds=int(row["correct_seconds"]),
-                incorrect_seconds=int(row["incorrect_seconds"]),
-                unknown_seconds=int(row["unknown_seconds"]),
-            )
-            for row in rows
-        }
-        result: list[DailyStatsRow] = []
-        cursor = start_day
-        for _ in range(days):
-            key = cursor.isoformat()
-            result.append(by_date.get(key, DailyStatsRow(key, 0, 0, 0)))
-            cursor = cursor.fromordinal(cursor.toordinal() + 1)
-        return result
+        by_date = {row.date: row for row in rows}
+        return [by_date.get(key) or DailyStatsRow(key, 0, 0, 0) for key in day_keys]
 
     def list_posture_events(self, day: date | None = None, limit: int = 200) -> list[PostureEventRow]:
         params: tuple[object, ...]
@@ -232,36 +434,26 @@ class Storage:
             "FROM posture_events"
         )
         if day is not None:
-            start = datetime.combine(day, datetime.min.time()).isoformat()
-            end = datetime.combine(day, datetime.max.time()).isoformat()
-            sql += " WHERE captured_at BETWEEN ? AND ?"
-            params = (start, end)
+            sql += " WHERE captured_at >= ? AND captured_at < ?"
+            params = _day_bounds(day)
         else:
             params = ()
 
         sql += " ORDER BY captured_at DESC LIMIT ?"
         params = (*params, max(1, int(limit)))
 
-        with self._lock, self._connect() as conn:
-            rows = conn.execute(sql, params).fetchall()
+        with self._read() as conn:
+            rows = self._tuple_cursor(conn).execute(sql, params).fetchall()
 
         events: list[PostureEventRow] = []
-        for row in rows:
-            reasons_raw = str(row["reasons"])
-            try:
-                parsed_reasons = json.loads(reasons_raw)
-                reasons = tuple(str(item) for item in parsed_reasons)
-            except Exception:
-                reasons = ()
-
-            confidence = row["confidence"]
+        for captured_at, status, reasons_raw, image_path, confidence in rows:
             events.append(
                 PostureEventRow(
-                    captured_at=str(row["captured_at"]),
-                    status=str(row["status"]),
-                    reasons=reasons,
-                    image_path=str(row["image_path"]),
-                    confidence=float(confidence) if confidence is not None else None,
+                    captured_at=captured_at,
+                    status=status,
+                    reasons=self._decode_reasons(reasons_raw),
+                    image_path=image_path,
+                    confidence=confidence,
                 )
             )
         return events
@@ -272,75 +464,112 @@ class Storage:
         if seconds <= 0:
             return
         day_key = day.isoformat()
-        now = datetime.now(timezone.utc).isoformat()
-        with self._lock, self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO screen_usage_stats(date, screen_seconds, updated_at)
-                VALUES (?, ?, ?)
-                ON CONFLICT(date) DO UPDATE SET
-                    screen_seconds = screen_seconds + excluded.screen_seconds,
-                    updated_at = excluded.updated_at
-                """,
-                (day_key, seconds, now),
-            )
+        with self._lock:
+            self._pending_screen[day_key] = self._pending_screen.get(day_key, 0) + seconds
+            due = self._stats_flush_due()
+        if due:
+            self.flush()
 
     def get_screen_usage_seconds(self, day: date) -> int:
         day_key = day.isoformat()
-        with self._lock, self._connect() as conn:
+        with self._connect_with_pending_stats() as conn:
             row = conn.execute(
                 "SELECT screen_seconds FROM screen_usage_stats WHERE date = ?",
                 (day_key,),
             ).fetchone()
         if row is None:
             return 0
-        return int(row["screen_seconds"])
+        return row["screen_seconds"]
+
+    def get_screen_usage_seconds_map(self, days: Iterable[date]) -> dict[date, int]:
+        """Screen seconds for several days in one query; days without a row are omitted."""
+        by_key = {day.isoformat(): day for day in days}
+        if not by_key:
+            return {}
+        placeholders = ",".join("?" * len(by_key))
+        with self._connect_with_pending_stats() as conn:
+            rows = conn.execute(
+                f"SELECT date, screen_seconds FROM screen_usage_stats WHERE date IN ({placeholders})",
+                tuple(by_key),
+            ).fetchall()
+        return {by_key[row["date"]]: row["screen_seconds"] for row in rows}
 
     def set_detection_start_if_missing(self, day: date, started_at: datetime) -> None:
         key = f"detection_start:{day.isoformat()}"
-        now = datetime.now(timezone.utc).isoformat()
-        with self._lock, self._connect() as conn:
-            existing = conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
-            if existing is not None:
-                return
-            conn.execute(
+        now = _utc_now_iso()
+        with self._connect() as conn:
+            inserted = conn.execute(
                 """
                 INSERT INTO settings(key, value, updated_at)
                 VALUES (?, ?, ?)
+                ON CONFLICT(key) DO NOTHING
                 """,
                 (key, started_at.isoformat(), now),
-            )
+            ).rowcount
+        if inserted:
+            self._bump_settings_version()
 
     def get_detection_start(self, day: date) -> str | None:
         key = f"detection_start:{day.isoformat()}"
-        with self._lock, self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
         if row is None:
             return None
-        return str(row["value"])
+        return row["value"]
+
+    def get_day_snapshot(self, day: date) -> DaySnapshot:
+        """Daily stats, screen usage and detection start for one day in a single query."""
+        day_key = day.isoformat()
+        with self._connect_with_pending_stats() as conn:
+            correct, incorrect, unknown, screen, started = self._tuple_cursor(conn).execute(
+                """
+                SELECT
+                    (SELECT correct_seconds FROM daily_stats WHERE date = :day),
+                    (SELECT incorrect_seconds FROM daily_stats WHERE date = :day),
+                    (SELECT unknown_seconds FROM daily_stats WHERE date = :day),
+                    (SELECT screen_seconds FROM screen_usage_stats WHERE date = :day),
+                    (SELECT value FROM settings WHERE key = :start_key)
+                """,
+                {"day": day_key, "start_key": f"detection_start:{day_key}"},
+            ).fetchone()
+        return DaySnapshot(
+            stats=DailyStatsRow(day_key, int(correct or 0), int(incorrect or 0), int(unknown or 0)),
+            screen_seconds=int(screen or 0),
+            detection_start=started,
+        )
 
     def get_first_posture_event_time(self, day: date) -> str | None:
-        start = datetime.combine(day, datetime.min.time()).isoformat()
-        end = datetime.combine(day, datetime.max.time()).isoformat()
-        with self._lock, self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 """
                 SELECT captured_at
                 FROM posture_events
-                WHERE captured_at BETWEEN ? AND ?
+                WHERE captured_at >= ? AND captured_at < ?
                 ORDER BY captured_at ASC
                 LIMIT 1
                 """,
-                (start, end),
+                _day_bounds(day),
             ).fetchone()
 
         if row is None:
             return None
-        return str(row["captured_at"])
+        return row["captured_at"]
+
+    @staticmethod
+    def _decode_reasons(raw: str) -> tuple[str, ...]:
+        if not raw:
+            return ()
+        if raw.startswith("["):
+            # Legacy JSON-encoded row.
+            try:
+                return tuple(str(item) for item in json.loads(raw))
+            except Exception:
+                return ()
+        return tuple(raw.split(_REASON_SEP))
 
     def _get_daily_stats_row(self, key: str) -> DailyStatsRow | None:
-        with self._lock, self._connect() as conn:
-            row = conn.execute(
+        with self._connect_with_pending_stats() as conn:
+            return self._daily_stats_cursor(conn).execute(
                 """
                 SELECT date, correct_seconds, incorrect_seconds, unknown_seconds
                 FROM daily_stats
@@ -348,11 +577,3 @@ class Storage:
                 """,
                 (key,),
             ).fetchone()
-        if row is None:
-            return None
-        return DailyStatsRow(
-            date=str(row["date"]),
-            correct_seconds=int(row["correct_seconds"]),
-            incorrect_seconds=int(row["incorrect_seconds"]),
-            unknown_seconds=int(row["unknown_seconds"]),
-        )
@@ -1,62 +1,136 @@
 from __future__ import annotations
 
+import functools
 import logging
 import platform
+import re
 import subprocess
+import threading
 import time
 from dataclasses import dataclass
-from datetime import date, datetime
-
-
-@dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable
+
+_IOKIT_PATH = "/System/Library/Frameworks/IOKit.framework/IOKit"
+_CORE_FOUNDATION_PATH = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+_CF_STRING_ENCODING_UTF8 = 0x08000100
+_CF_NUMBER_SINT64_TYPE = 4
+# How often the background thread samples OS idle time (see SystemUsageService).
+_IDLE_POLL_SECONDS = 1.0
+# The OS screen-time probes spawn processes (and pmset can print megabytes), so results are
+# reused for this long; the dashboard refreshes far more often than that.
+_SCREEN_TIME_TTL_SECONDS = 10.0
+# (day, monotonic time of the probe, result)
+_screen_time_cache: tuple[date, float, int | None] | None = None
+# ioreg prints e.g. "HIDIdleTime" = 123456789 (nanoseconds).
+_HID_IDLE_RE = re.compile(rb'"HIDIdleTime"\s*=\s*(\d+)')
+# Set on the first successful kern.boottime read (see _macos_boot_and_wake_timestamps).
+_macos_boot_timestamp: int | None = None
+# sysctl -n kern.boottime: "{ sec = 1704067200, usec = 0 } Mon Jan  1 00:00:00 2024".
+_BOOTTIME_RE = re.compile(r"\bsec\s*=\s*(\d+)")
+# A pmset log line mentioning a wake, e.g. "2024-01-15 08:30:45 +0800 Wake  ...".
+_PMSET_WAKE_RE = re.compile(
+    rb"^[ \t]*(\d{4}-\d{2}-\d{2})[ \t]+(\d{2}:\d{2}:\d{2})[^\n]*wake",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+@dataclass(frozen=True)
 class SystemUsageSnapshot:
+    __slots__ = ("idle_seconds",)
+
     idle_seconds: float | None
 
 
+@functools.lru_cache(maxsize=1)
+def _macos_hid_idle_reader() -> Callable[[], float | None] | None:
+    """Bind IOKit/CoreFoundation once and return a reader for HIDIdleTime, or None."""
+    try:
+        import ctypes
+
+        iokit = ctypes.CDLL(_IOKIT_PATH)
+        cf = ctypes.CDLL(_CORE_FOUNDATION_PATH)
+
+        iokit.IOServiceMatching.restype = ctypes.c_void_p
+        iokit.IOServiceMatching.argtypes = [ctypes.c_char_p]
+        iokit.IOServiceGetMatchingService.restype = ctypes.c_uint32
+        iokit.IOServiceGetMatchingService.argtypes = [ctypes.c_uint32, ctypes.c_void_p]
+        iokit.IORegistryEntryCreateCFProperty.restype = ctypes.c_void_p
+        iokit.IORegistryEntryCreateCFProperty.argtypes = [
+            ctypes.c_uint32,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_uint32,
+        ]
+        cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+        cf.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+        cf.CFGetTypeID.restype = ctypes.c_ulong
+        cf.CFGetTypeID.argtypes = [ctypes.c_void_p]
+        cf.CFNumberGetTypeID.restype = ctypes.c_ulong
+        cf.CFNumberGetValue.restype = ctypes.c_bool
+        cf.CFNumberGetValue.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p]
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+
+        # The IOHIDSystem service lives as long as the OS session, so it is looked up once.
+        # IOServiceGetMatchingService consumes the matching dictionary; port 0 is the default.
+        service = iokit.IOServiceGetMatchingService(0, iokit.IOServiceMatching(b"IOHIDSystem"))
+        if not service:
+            return None
+        key = cf.CFStringCreateWithCString(None, b"HIDIdleTime", _CF_STRING_ENCODING_UTF8)
+        if not key:
+            return None
+        number_type = cf.CFNumberGetTypeID()
+    except Exception:
+        return None
+
+    create_property = iokit.IORegistryEntryCreateCFProperty
+
+    def read() -> float | None:
+        prop = create_property(service, key, None, 0)
+        if not prop:
+            return None
+        try:
+            if cf.CFGetTypeID(prop) != number_type:
+                return None
+            value = ctypes.c_int64()
+            if not cf.CFNumberGetValue(prop, _CF_NUMBER_SINT64_TYPE, ctypes.byref(value)):
+                return None
+            return value.value / 1e9
+        finally:
+            cf.CFRelease(prop)
+
+    return read
+
+
 def _idle_seconds_macos() -> float | None:
-    # Use ioreg to query IOHIDSystem HIDIdleTime (ns).
-    # Example output contains: "HIDIdleTime" = 123456789
+    reader = _macos_hid_idle_reader()
+    if reader is not None:
+        try:
+            idle = reader()
+        except Exception:
+            idle = None
+        if idle is not None:
+            return idle
+    return _idle_seconds_macos_ioreg()
+
+
+def _idle_seconds_macos_ioreg() -> float | None:
+    # Fallback: use ioreg to query IOHIDSystem HIDIdleTime (ns).
+    # The output is matched as raw bytes; only the number is ever decoded.
     try:
         proc = subprocess.run(
             ["ioreg", "-c", "IOHIDSystem"],
             capture_output=True,
-            text=True,
             check=False,
             timeout=1.5,
         )
     except Exception:
         return None
 
-    out = proc.stdout
-    if not out:
+    match = _HID_IDLE_RE.search(proc.stdout or b"")
+    if match is None:
         return None
-
-    key = "HIDIdleTime"
-    idx = out.find(key)
-    if idx < 0:
-        return None
-
-    snippet = out[idx : idx + 300]
-    # Best-effort parse for the first integer after '='.
-    eq = snippet.find("=")
-    if eq < 0:
-        return None
-
-    tail = snippet[eq + 1 :]
-    digits = ""
-    for ch in tail:
-        if ch.isdigit():
-            digits += ch
-        elif digits:
-            break
-    if not digits:
-        return None
-
-    try:
-        ns = int(digits)
-    except ValueError:
-        return None
-    return ns / 1e9
+    return int(match.group(1)) / 1e9
 
 
 def _idle_seconds_windows() -> float | None:
@@ -73,19 +147,65 @@ def _idle_seconds_windows() -> float | None:
             return None
 
         tick = ctypes.windll.kernel32.GetTickCount64()
-        idle_ms = int(tick) - int(last_input_info.dwTime)
+        # dwTime is a 32-bit tick count that wraps every ~49.7 days; compare modulo 2**32.
+        idle_ms = (int(tick) - int(last_input_info.dwTime)) & 0xFFFFFFFF
         return max(0.0, idle_ms / 1000.0)
     except Exception:
         return None
 
 
 def get_idle_seconds() -> float | None:
-    system = platform.system().lower()
-    if system == "darwin":
-        return _idle_seconds_macos()
-    if system == "windows":
-        return _idle_seconds_windows()
-    return None
+    return _idle_impl()
+
+
+def _last_wake_from_pmset_log(now: datetime) -> datetime | None:
+    """Latest wake logged today by `pmset -g log`; slow (the log can be megabytes)."""
+    # The log is searched as raw bytes; decoding megabytes of it would only find ASCII.
+    proc = subprocess.run(
+        ["pmset", "-g", "log"],
+        capture_output=True,
+        timeout=3,
+    )
+    out = proc.stdout
+    if proc.returncode != 0 or not out:
+        return None
+
+    today = now.date().isoformat().encode("ascii")
+    # The log is chronological, so only the part from today's first entry onward is
+    # scanned. Same-day HH:MM:SS strings order like the times they encode, so the
+    # latest wake is tracked as a string and parsed once.
+    start = 0 if out.startswith(today) else out.find(b"\n" + today)
+    last_wake_time = None
+    if start >= 0:
+        for match in _PMSET_WAKE_RE.finditer(out, start):
+            if match.group(1) == today and (
+                last_wake_time is None or match.group(2) > last_wake_time
+            ):
+                last_wake_time = match.group(2)
+    if last_wake_time is None:
+        return None
+    return datetime.strptime((today + b" " + last_wake_time).decode("ascii"), "%Y-%m-%d %H:%M:%S")
+
+
+def _macos_boot_and_wake_timestamps() -> tuple[int | None, int | None]:
+    """(kern.boottime, kern.waketime) in epoch seconds; wake is None where unsupported.
+
+    Boot time cannot change while the process runs, so after the first successful read
+    only the wake time is queried.
+    """
+    global _macos_boot_timestamp
+    names = ["kern.waketime"] if _macos_boot_timestamp is not None else ["kern.boottime", "kern.waketime"]
+    # Older systems without kern.waketime print only what they know (and exit non-zero).
+    proc = subprocess.run(
+        ["sysctl", "-n", *names],
+        capture_output=True,
+        text=True,
+        timeout=1,
+    )
+    stamps = [int(match.group(1)) for match in _BOOTTIME_RE.finditer(proc.stdout or "")]
+    if _macos_boot_timestamp is None and stamps:
+        _macos_boot_timestamp = stamps.pop(0)
+    return _macos_boot_timestamp, (stamps[0] if stamps else None)
 
 
 def _get_macos_screen_time_today() -> int | None:
@@ -98,82 +218,40 @@ def _get_macos_screen_time_today() -> int | None:
     Returns screen time in seconds, or None if unavailable.
     """
     try:
-        # Get system wake time using ioreg
-        proc = subprocess.run(
-            ["ioreg", "-n", "IOHIDSystem", "-a"],
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
-        if proc.returncode != 0:
-            return None
-        
-        # Try to get last wake time from pmset
-        proc = subprocess.run(
-            ["pmset", "-g", "log"],
-            capture_output=True,
-            text=True,
-            timeout=3,
-        )
-        
-        if proc.returncode == 0 and proc.stdout:
-            from datetime import timezone
-            now = datetime.now()
-            today = now.date()
-            
-            # Parse pmset log for today's wake events
-            wake_times = []
-            for line in proc.stdout.split('\n'):
-                if 'Wake' in line or 'wake' in line.lower():
-                    # Lines look like: "2024-01-15 08:30:45 +0800"
-                    try:
-                        # Extract timestamp
-                        parts = line.strip().split()
-                        if len(parts) >= 2:
-                            date_str = parts[0]
-                            time_str = parts[1]
-                            if date_str.startswith(str(today)):
-                                dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S")
-                                wake_times.append(dt)
-                    except Exception:
-                        continue
-            
-            if wake_times:
-                # Use the last wake time
-                last_wake = max(wake_times)
-                elapsed = (now - last_wake).total_seconds()
-                
-                # Get current idle time
-                idle = _idle_seconds_macos()
-                if idle is not None:
-                    # Screen time = elapsed since wake - idle time
-                    screen_time = max(0, int(elapsed - idle))
-                    return screen_time
-                return int(elapsed)
-        
+        boot_timestamp, wake_timestamp = _macos_boot_and_wake_timestamps()
+        now = datetime.now()
+
+        if wake_timestamp is not None:
+            # A zero or pre-today wake time means no wake today: fall through to uptime.
+            last_wake = datetime.fromtimestamp(wake_timestamp) if wake_timestamp > 0 else None
+            if last_wake is not None and last_wake.date() != now.date():
+                last_wake = None
+        else:
+            # No kern.waketime: fall back to scanning the power management log.
+            last_wake = _last_wake_from_pmset_log(now)
+
+        if last_wake is not None:
+            elapsed = (now - last_wake).total_seconds()
+
+            # Get current idle time
+            idle = _idle_seconds_macos()
+            if idle is not None:
+                # Screen time = elapsed since wake - idle time
+                screen_time = max(0, int(elapsed - idle))
+                return screen_time
+            return int(elapsed)
+
         # Fallback: use system uptime
-        proc = subprocess.run(
-            ["sysctl", "-n", "kern.boottime"],
-            capture_output=True,
-            text=True,
-            timeout=1,
-        )
-        if proc.returncode == 0 and proc.stdout:
-            # Parse: { sec = 1704067200, usec = 0 } Mon Jan  1 00:00:00 2024
-            import re
-            match = re.search(r'sec\s*=\s*(\d+)', proc.stdout)
-            if match:
-                boot_timestamp = int(match.group(1))
-                boot_time = datetime.fromtimestamp(boot_timestamp)
-                now = datetime.now()
-                elapsed = (now - boot_time).total_seconds()
-                
-                # Get current idle time
-                idle = _idle_seconds_macos()
-                if idle is not None:
-                    screen_time = max(0, int(elapsed - idle))
-                    return min(screen_time, 86400)  # Cap at 24 hours
-                return min(int(elapsed), 86400)
+        if boot_timestamp is not None:
+            boot_time = datetime.fromtimestamp(boot_timestamp)
+            elapsed = (now - boot_time).total_seconds()
+
+            # Get current idle time
+            idle = _idle_seconds_macos()
+            if idle is not None:
+                screen_time = max(0, int(elapsed - idle))
+                return min(screen_time, 86400)  # Cap at 24 hours
+            return min(int(elapsed), 86400)
     except Exception:
         pass
     return None
@@ -182,42 +260,25 @@ def _get_macos_screen_time_today() -> int | None:
 def _get_windows_screen_time_today() -> int | None:
     """Try to get screen time from Windows.
     
-    Uses Windows Event Log or WMI to estimate screen on time.
+    Estimates screen on time as system uptime minus the current idle time.
     Returns screen time in seconds, or None if unavailable.
     """
     try:
-        # Try using WMI to get system boot time and calculate uptime
-        import subprocess
-        
-        # Get system boot time
-        result = subprocess.run(
-            ["wmic", "path", "Win32_OperatingSystem", "get", "LastBootUpTime"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        
-        if result.returncode == 0:
-            # Parse boot time from output
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('LastBootUpTime'):
-                    # Format: 20240101120000.000000+480
-                    boot_time_str = line.split('.')[0]
-                    if len(boot_time_str) >= 14:
-                        boot_time = datetime.strptime(boot_time_str[:14], "%Y%m%d%H%M%S")
-                        now = datetime.now()
-                        uptime_seconds = int((now - boot_time).total_seconds())
-                        
-                        # Get idle time to estimate active time
-                        idle_seconds = _idle_seconds_windows()
-                        if idle_seconds is not None:
-                            # Screen time = uptime - idle time (approximate)
-                            # We assume screen was on during uptime
-                            screen_time = max(0, uptime_seconds - int(idle_seconds))
-                            return min(screen_time, 86400)  # Cap at 24 hours
-                        return min(uptime_seconds, 86400)
+        import ctypes
+
+        # Milliseconds since boot, straight from the kernel (no WMI process).
+        get_tick_count = ctypes.windll.kernel32.GetTickCount64
+        get_tick_count.restype = ctypes.c_uint64
+        uptime_seconds = int(get_tick_count()) // 1000
+
+        # Get idle time to estimate active time
+        idle_seconds = _idle_seconds_windows()
+        if idle_seconds is not None:
+            # Screen time = uptime - idle time (approximate)
+            # We assume screen was on during uptime
+            screen_time = max(0, uptime_seconds - int(idle_seconds))
+            return min(screen_time, 86400)  # Cap at 24 hours
+        return min(uptime_seconds, 86400)
     except Exception:
         pass
     return None
@@ -228,15 +289,35 @@ def get_system_screen_time_today() -> int | None:
     
     Returns screen time in seconds, or None if not available.
     This is a best-effort function that tries to read from OS APIs.
+    Results are cached for a few seconds and never reused across a date change.
     """
-    system = platform.system().lower()
-    if system == "darwin":
-        return _get_macos_screen_time_today()
-    if system == "windows":
-        return _get_windows_screen_time_today()
+    global _screen_time_cache
+    today = date.today()
+    now = time.monotonic()
+    cached = _screen_time_cache
+    if cached is not None and cached[0] == today and now - cached[1] < _SCREEN_TIME_TTL_SECONDS:
+        return cached[2]
+    result = _probe_system_screen_time_today()
+    _screen_time_cache = (today, now, result)
+    return result
+
+
+def _unsupported_platform() -> None:
     return None
 
 
+# The platform never changes at runtime, so the implementations are picked once.
+_SYSTEM = platform.system().lower()
+_idle_impl: Callable[[], float | None] = {
+    "darwin": _idle_seconds_macos,
+    "windows": _idle_seconds_windows,
+}.get(_SYSTEM, _unsupported_platform)
+_probe_system_screen_time_today: Callable[[], int | None] = {
+    "darwin": _get_macos_screen_time_today,
+    "windows": _get_windows_screen_time_today,
+}.get(_SYSTEM, _unsupported_platform)
+
+
 class SystemUsageService:
     """Accumulate 'screen usage' time from OS idle-time signal.
 
@@ -250,13 +331,58 @@ class SystemUsageService:
 
     def __init__(self, *, idle_cutoff_seconds: int = 90) -> None:
         self.idle_cutoff_seconds = max(10, int(idle_cutoff_seconds))
+        self._idle_cutoff = float(self.idle_cutoff_seconds)
+        # Filled by the polling thread once start_background() runs; read lock-free by tick().
+        self._latest_idle: float | None = None
+        self._poll_stop = threading.Event()
+        self._poll_thread: threading.Thread | None = None
         self._last_tick_monotonic: float | None = None
+        # Local day of the last tick and its [start, end) as wall-clock timestamps.
+        self._cached_today: date | None = None
+        self._day_start = 0.0
+        self._day_end = 0.0
         self._log = logging.getLogger(__name__)
 
+    def start_background(self) -> None:
+        """Sample OS idle time on a daemon thread so tick() never waits on the OS probe."""
+        if self._poll_thread is not None:
+            return
+        self._latest_idle = get_idle_seconds()
+        self._poll_stop = threading.Event()
+        self._poll_thread = threading.Thread(
+            target=self._poll_idle,
+            args=(self._poll_stop,),
+            name="sitalarm-idle-poll",
+            daemon=True,
+        )
+        self._poll_thread.start()
+
+    def stop_background(self) -> None:
+        thread = self._poll_thread
+        if thread is None:
+            return
+        self._poll_thread = None
+        self._poll_stop.set()
+        thread.join(timeout=_IDLE_POLL_SECONDS)
+
+    def _poll_idle(self, stop: threading.Event) -> None:
+        while not stop.wait(_IDLE_POLL_SECONDS):
+            self._latest_idle = get_idle_seconds()
+
+    def _today(self) -> date:
+        # Wall-clock bounds rather than monotonic ones: monotonic time stops during system
+        # sleep on some platforms, and a sleep across midnight must still roll the day.
+        wall = time.time()
+        if self._cached_today is None or not self._day_start <= wall < self._day_end:
+            today = datetime.fromtimestamp(wall).date()
+            self._cached_today = today
+            self._day_start = datetime.combine(today, datetime.min.time()).timestamp()
+            self._day_end = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+        return self._cached_today
+
     def tick(self) -> tuple[date, int]:
         """Return (day, active_delta_seconds) since last tick."""
-        now = datetime.now()
-        today = now.date()
+        today = self._today()
 
         t = time.monotonic()
         if self._last_tick_monotonic is None:
@@ -268,15 +394,12 @@ class SystemUsageService:
         if dt <= 0:
             return today, 0
 
-        idle = get_idle_seconds()
+        idle = self._latest_idle if self._poll_thread is not None else get_idle_seconds()
         if idle is None:
             # If OS idle is unavailable, fall back to counting all time while app is running.
             return today, int(dt)
 
-        if idle <= float(self.idle_cutoff_seconds):
-            return today, int(dt)
-
-        return today, 0
+        return today, int(dt) if idle <= self._idle_cutoff else 0
 
     def get_today_screen_time(self) -> int:
         """Get today's total screen time in seconds.
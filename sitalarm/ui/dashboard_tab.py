@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from pathlib import Path
 
 from PyQt5.QtCore import Qt, pyqtSignal
@@ -12,12 +13,17 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QScrollArea,
     QSizePolicy,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
 from sitalarm.services.stats_service import DaySummary
+from sitalarm.ui.effects import qthrottled
+
+# set_last_event reloads the capture image from disk, so bursts are collapsed to the newest.
+_LAST_EVENT_THROTTLE_MS = 66
+# Lines kept by append_message; the message area only has room for a few.
+_MESSAGE_HISTORY = 4
 
 
 class DashboardTab(QWidget):
@@ -25,9 +31,48 @@ class DashboardTab(QWidget):
     pause_requested = pyqtSignal()
     resume_requested = pyqtSignal()
 
+    # Badge text and complete stylesheet per status, built once instead of per event.
+    _BADGE_CSS = {
+        "correct": (
+            "坐姿正确",
+            "color: #16a34a; background: rgba(22,163,74,0.12); font-weight: 700; "
+            "font-size: 14px; padding: 4px 12px; border-radius: 6px;",
+        ),
+        "incorrect": (
+            "坐姿错误",
+            "color: #dc2626; background: rgba(220,38,38,0.12); font-weight: 700; "
+            "font-size: 14px; padding: 4px 12px; border-radius: 6px;",
+        ),
+        "unknown": (
+            "未检测到",
+            "color: #64748b; background: rgba(100,116,139,0.12); font-weight: 700; "
+            "font-size: 14px; padding: 4px 12px; border-radius: 6px;",
+        ),
+    }
+    _BADGE_CSS_DEFAULT = ("--", _BADGE_CSS["unknown"][1])
+
     def __init__(self) -> None:
         super().__init__()
-        self._build_ui()
+        self._badge_status: str | None = None
+        # Last text set per label (by id), so unchanged values skip Qt entirely.
+        self._label_cache: dict[int, str] = {}
+        self._message_lines: deque[str] = deque(maxlen=_MESSAGE_HISTORY)
+        # (path, mtime_ns, width, height) of the capture currently on screen.
+        self._capture_key: tuple[str, int, int, int] | None = None
+        # Widgets are built on first show; setters called before that are replayed then.
+        self._built = False
+        self._pending: dict[str, tuple[object, ...]] = {}
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        if not self._built:
+            self._build_ui()
+            self._built = True
+            pending, self._pending = self._pending, {}
+            for name, args in pending.items():
+                getattr(self, name)(*args)
+            if self._message_lines:
+                self._set_text(self.message_box, "\n".join(self._message_lines))
+        super().showEvent(event)
 
     def _build_ui(self) -> None:
         outer = QVBoxLayout(self)
@@ -72,6 +117,7 @@ class DashboardTab(QWidget):
         self.unknown_label = self._build_stat_item("unknown", "未检测到用户", row)
         stats_layout.addLayout(row)
         root.addWidget(stats_card)
+        self._stats_card = stats_card
 
         # ---- Latest Detection Card ----
         detection_card = QFrame()
@@ -147,13 +193,13 @@ class DashboardTab(QWidget):
         det_body.addLayout(metrics_panel, 1)
         det_layout.addLayout(det_body)
 
-        # Message area
-        self.message_box = QTextEdit()
-        self.message_box.setReadOnly(True)
+        # Message area (a plain label: no document layout per update)
+        self.message_box = QLabel("")
         self.message_box.setObjectName("DashboardMessageBox")
-        self.message_box.setFrameShape(QFrame.NoFrame)
-        self.message_box.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.message_box.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.message_box.setWordWrap(True)
+        self.message_box.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.message_box.setTextFormat(Qt.PlainText)
+        self.message_box.setTextInteractionFlags(Qt.TextSelectableByMouse)
         self.message_box.setMinimumHeight(48)
         self.message_box.setMaximumHeight(80)
         det_layout.addWidget(self.message_box)
@@ -217,6 +263,14 @@ class DashboardTab(QWidget):
         parent_layout.addWidget(card, 1)
         return value
 
+    def _set_text(self, label: QLabel, text: str) -> bool:
+        # QLabel.setText relayouts and repaints even when the text is unchanged.
+        if self._label_cache.get(id(label)) == text:
+            return False
+        label.setText(text)
+        self._label_cache[id(label)] = text
+        return True
+
     @staticmethod
     def _metric_icon(accent: str) -> str:
         if accent == "correct":
@@ -228,65 +282,99 @@ class DashboardTab(QWidget):
     # ---- public API ----
 
     def set_state_text(self, text: str) -> None:
+        if not self._built:
+            self._pending["set_state_text"] = (text,)
+            return
         self.status_label.setText(f"状态: {text}")
 
     def set_day_summary(self, summary: DaySummary) -> None:
-        correct_minutes = int(summary.correct_seconds // 60)
-        incorrect_minutes = int(summary.incorrect_seconds // 60)
-        unknown_minutes = int(summary.unknown_seconds // 60)
-        self.correct_label.setText(str(correct_minutes))
-        self.incorrect_label.setText(str(incorrect_minutes))
-        self.unknown_label.setText(str(unknown_minutes))
-
+        if not self._built:
+            self._pending["set_day_summary"] = (summary,)
+            return
+        values = (
+            (self.correct_label, str(int(summary.correct_seconds // 60))),
+            (self.incorrect_label, str(int(summary.incorrect_seconds // 60))),
+            (self.unknown_label, str(int(summary.unknown_seconds // 60))),
+        )
+        if all(self._label_cache.get(id(label)) == text for label, text in values):
+            return
+        # Update the three metric cards under one repaint of the stats card.
+        self._stats_card.setUpdatesEnabled(False)
+        try:
+            for label, text in values:
+                self._set_text(label, text)
+        finally:
+            self._stats_card.setUpdatesEnabled(True)
+
+    @qthrottled(_LAST_EVENT_THROTTLE_MS)
     def set_last_event(self, payload: dict[str, object]) -> None:
+        if not self._built:
+            self._pending["set_last_event"] = (payload,)
+            return
         status = str(payload.get("status", "unknown"))
         at = str(payload.get("time", "--:--:--"))
-        self.last_event_label.setText(f"时间: {at}")
+        self._set_text(self.last_event_label, f"时间: {at}")
 
         # Status badge
-        badge_map = {
-            "correct": ("坐姿正确", "#16a34a", "rgba(22,163,74,0.12)"),
-            "incorrect": ("坐姿错误", "#dc2626", "rgba(220,38,38,0.12)"),
-            "unknown": ("未检测到", "#64748b", "rgba(100,116,139,0.12)"),
-        }
-        text, color, bg = badge_map.get(status, ("--", "#64748b", "rgba(100,116,139,0.12)"))
-        self._status_badge.setText(text)
-        self._status_badge.setStyleSheet(
-            f"color: {color}; background: {bg}; font-weight: 700; font-size: 14px; "
-            f"padding: 4px 12px; border-radius: 6px;"
-        )
+        if status != self._badge_status:
+            # setStyleSheet re-polishes the widget, so only restyle when the status changes.
+            self._badge_status = status
+            text, css = self._BADGE_CSS.get(status, self._BADGE_CSS_DEFAULT)
+            self._status_badge.setText(text)
+            self._status_badge.setStyleSheet(css)
 
         # Detection metrics
-        def _fmt(val: object) -> str:
-            if isinstance(val, (int, float)):
-                return f"{float(val):.4f}"
-            return "--"
-
-        self._head_ratio_label.setText(_fmt(payload.get("head_ratio")))
-        self._head_ratio_threshold_label.setText(_fmt(payload.get("threshold_head_ratio")))
-        self._head_forward_label.setText(_fmt(payload.get("head_forward_ratio")))
-        self._head_forward_threshold_label.setText(_fmt(payload.get("threshold_head_forward")))
+        for label, key in (
+            (self._head_ratio_label, "head_ratio"),
+            (self._head_ratio_threshold_label, "threshold_head_ratio"),
+            (self._head_forward_label, "head_forward_ratio"),
+            (self._head_forward_threshold_label, "threshold_head_forward"),
+        ):
+            val = payload.get(key)
+            self._set_text(label, "%.4f" % val if isinstance(val, (int, float)) else "--")
 
         # Capture image
         image_path = str(payload.get("image_path", ""))
-        if image_path and Path(image_path).is_file():
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    self.capture_image_label.size(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation,
-                )
-                self.capture_image_label.setPixmap(scaled)
+        try:
+            mtime_ns = Path(image_path).stat().st_mtime_ns if image_path else None
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is not None:
+            self._show_capture(image_path, mtime_ns)
         else:
-            self.capture_image_label.setText("暂无图片")
+            self._capture_key = None
+            self._set_text(self.capture_image_label, "暂无图片")
 
         # Message box
         message = str(payload.get("message", "") or "")
         self.set_current_message(message)
 
+    def _show_capture(self, image_path: str, mtime_ns: int) -> None:
+        size = self.capture_image_label.size()
+        key = (image_path, mtime_ns, size.width(), size.height())
+        if key == self._capture_key:
+            # Same file at the same label size: already on screen, skip decode and scale.
+            return
+        pixmap = QPixmap(image_path)
+        if pixmap.isNull():
+            return
+        scaled = pixmap.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.capture_image_label.setPixmap(scaled)
+        # setPixmap clears the label text.
+        self._label_cache.pop(id(self.capture_image_label), None)
+        self._capture_key = key
+
     def set_current_message(self, message: str) -> None:
-        self.message_box.setPlainText(message.strip())
+        text = message.strip()
+        self._message_lines.clear()
+        if text:
+            self._message_lines.append(text)
+        if self._built:
+            self._set_text(self.message_box, text)
 
     def append_message(self, message: str) -> None:
-        self.message_box.append(message)
+        if not message or (self._message_lines and self._message_lines[-1] == message):
+            return
+        self._message_lines.append(message)
+        if self._built:
+            self._set_text(self.message_box, "\n".join(self._message_lines))
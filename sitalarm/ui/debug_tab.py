@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Any
 
 from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QImage, QPainter, QPen, QPixmap
+from PyQt5.QtGui import QColor, QImage, QPainter, QPen, QPixmap, QPixmapCache
 from PyQt5.QtWidgets import (
     QFrame,
     QGroupBox,
@@ -16,13 +16,49 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
+from sitalarm.ui.effects import qthrottled
+
+# Qt >= 5.14 reads OpenCV's BGR byte order directly; older Qt needs an RGB swap.
+_FORMAT_BGR888 = getattr(QImage, "Format_BGR888", None)
+# Preview/info refreshes are capped at ~15 per second; newer payloads supersede queued ones.
+_PREVIEW_THROTTLE_MS = 66
+
+
+def _detach_frame(payload: dict[str, object]) -> tuple[tuple[Any, ...], dict[str, Any]]:
+    # payload["frame"] is LivePreviewService's overlay buffer, which the next
+    # draw_pose_overlay overwrites in place; a deferred update needs its own copy.
+    frame = payload.get("frame")
+    if frame is not None and hasattr(frame, "copy"):
+        payload = {**payload, "frame": frame.copy()}
+    return (payload,), {}
+
 
 class DebugTab(QWidget):
     debug_capture_requested = pyqtSignal()
 
+    # Face-box pens, built once instead of parsing the colour strings every frame.
+    _STATUS_PENS = {
+        "incorrect": QPen(QColor("#ff3d3d"), 3),
+        "correct": QPen(QColor("#ff8a00"), 3),
+    }
+    _DEFAULT_PEN = QPen(QColor("#9ca3af"), 3)
+
     def __init__(self) -> None:
         super().__init__()
-        self._build_ui()
+        # Last text set per label (by id), so unchanged values skip Qt entirely.
+        self._label_cache: dict[int, str] = {}
+        # Widgets are built on first show; until then only the newest payload is kept.
+        self._built = False
+        self._pending: dict[str, object] | None = None
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        if not self._built:
+            self._build_ui()
+            self._built = True
+            if self._pending is not None:
+                payload, self._pending = self._pending, None
+                self.update_debug_info(payload)
+        super().showEvent(event)
 
     def _build_ui(self) -> None:
         outer = QVBoxLayout(self)
@@ -97,7 +133,12 @@ class DebugTab(QWidget):
 
         root.addStretch(1)
 
+    @qthrottled(_PREVIEW_THROTTLE_MS, detach=_detach_frame)
     def update_debug_info(self, payload: dict[str, object]) -> None:
+        if not self._built:
+            # Live frames are only wanted on screen; don't keep one alive for a hidden tab.
+            self._pending = {key: value for key, value in payload.items() if key != "frame"}
+            return
         debug_info = payload.get("debug_info", {})
         if not isinstance(debug_info, dict):
             debug_info = {}
@@ -130,21 +171,29 @@ class DebugTab(QWidget):
 
         face_text = str(face_box) if isinstance(face_box, tuple) else "-"
 
-        self.left_info.setText(
+        self._set_text(
+            self.left_info,
             f"时间: {payload.get('time', '-')}\n"
             f"来源: {source}\n"
             f"判定: {status}\n"
             f"头点比: {ratio_text}\n"
-            f"原因: {reason_text}"
+            f"原因: {reason_text}",
         )
 
-        self.right_info.setText(
+        self._set_text(
+            self.right_info,
             f"亮度: {brightness}\n"
             f"头点比较准比: {compare_text}\n"
             f"状态: {status_text}\n"
-            f"实际比: {face_text}"
+            f"实际比: {face_text}",
         )
 
+    def _set_text(self, label: QLabel, text: str) -> None:
+        # QLabel.setText relayouts and repaints even when the text is unchanged.
+        if self._label_cache.get(id(label)) != text:
+            label.setText(text)
+            self._label_cache[id(label)] = text
+
     @staticmethod
     def _reason_text(reasons: object) -> str:
         if isinstance(reasons, list) and reasons:
@@ -160,10 +209,23 @@ class DebugTab(QWidget):
         return float(value) >= float(threshold)
 
     def _set_preview_from_path(self, image_path: str) -> None:
-        if image_path and Path(image_path).exists():
+        try:
+            mtime_ns = Path(image_path).stat().st_mtime_ns if image_path else None
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is not None:
+            # The same capture is often shown repeatedly; reuse its decoded, scaled pixmap.
+            size = self.preview_label.size()
+            key = f"debug-preview:{image_path}:{mtime_ns}:{size.width()}x{size.height()}"
+            cached = QPixmapCache.find(key)
+            if cached is not None and not cached.isNull():
+                self.preview_label.setPixmap(cached)
+                return
             pixmap = QPixmap(image_path)
             if not pixmap.isNull():
-                self._set_scaled_pixmap(pixmap)
+                shown = self._set_scaled_pixmap(pixmap)
+                if shown is not None:
+                    QPixmapCache.insert(key, shown)
                 return
 
         self.preview_label.setPixmap(QPixmap())
@@ -179,21 +241,23 @@ class DebugTab(QWidget):
             return
 
         try:
-            # 创建 QImage，需要确保数据在 QImage 使用期间有效
-            # 关键：先复制 frame 数据，再传给 QImage
+            # QImage 直接包装 frame 的内存（不复制）；QPixmap.fromImage 会拷贝像素，
+            # 所以 frame 只需在本函数内保持存活。
             if len(shape) >= 3 and shape[2] >= 3:
-                # BGR 转 RGB (OpenCV 使用 BGR 格式，Qt 需要 RGB)
-                # 先深拷贝 frame 的数据，避免 view 问题
-                rgb_data = frame[:, :, :3][:, :, ::-1].copy()
-                # 现在可以从 rgb_data 创建 QImage，因为 rgb_data 拥有独立的数据
-                image = QImage(rgb_data.data, frame_width, frame_height, 3 * frame_width, QImage.Format_RGB888)
-                # 清理临时数据
-                del rgb_data
+                if shape[2] > 3 or not frame.flags["C_CONTIGUOUS"]:
+                    frame = frame[:, :, :3].copy()
+                if _FORMAT_BGR888 is not None:
+                    image = QImage(frame.data, frame_width, frame_height, frame.strides[0], _FORMAT_BGR888)
+                else:
+                    # 旧版 Qt: 按 RGB 包装后由 Qt 交换通道 (OpenCV 使用 BGR 格式)
+                    image = QImage(
+                        frame.data, frame_width, frame_height, frame.strides[0], QImage.Format_RGB888
+                    ).rgbSwapped()
             else:
                 # 灰度图
-                gray_data = frame.copy()
-                image = QImage(gray_data.data, frame_width, frame_height, frame_width, QImage.Format_Grayscale8)
-                del gray_data
+                if not frame.flags["C_CONTIGUOUS"]:
+                    frame = frame.copy()
+                image = QImage(frame.data, frame_width, frame_height, frame.strides[0], QImage.Format_Grayscale8)
 
             if image.isNull():
                 return
@@ -203,19 +267,15 @@ class DebugTab(QWidget):
                 return
 
             if isinstance(face_box, tuple) and len(face_box) == 4:
-                color = self._status_color(status)
-                # 使用 with 语句自动管理 QPainter 生命周期
+                # 使用 with 语句自动管理 QPainter 生命周期；
+                # 轴对齐矩形不需要抗锯齿
                 with QPainter(pixmap) as painter:
-                    painter.setRenderHint(QPainter.Antialiasing)
-                    painter.setPen(QPen(color, 3))
+                    painter.setPen(self._STATUS_PENS.get(status, self._DEFAULT_PEN))
                     x, y, w, h = [int(value) for value in face_box]
                     painter.drawRect(x, y, w, h)
 
             # 设置缩放后的 pixmap 到预览标签
-            target_size = self.preview_label.size()
-            if not target_size.isEmpty():
-                scaled = pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.FastTransformation)
-                self.preview_label.setPixmap(scaled)
+            self._set_scaled_pixmap(pixmap)
 
         except Exception as e:
             # 记录异常以便调试
@@ -224,24 +284,24 @@ class DebugTab(QWidget):
             traceback.print_exc()
             pass
 
-    def _set_scaled_pixmap(self, pixmap: QPixmap) -> None:
+    def _set_scaled_pixmap(self, pixmap: QPixmap) -> QPixmap | None:
+        """Show pixmap fitted to the preview label; returns what was shown."""
         target_size = self.preview_label.size()
         if target_size.isEmpty():
-            return
-        # 直接缩放并显示，不保留中间副本
-        scaled = pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.FastTransformation)
+            return None
+        # 尺寸已匹配（或按比例缩放后不变）时跳过 scaled()
+        source_size = pixmap.size()
+        if source_size == target_size or source_size.scaled(target_size, Qt.KeepAspectRatio) == source_size:
+            scaled = pixmap
+        else:
+            scaled = pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.FastTransformation)
         self.preview_label.setPixmap(scaled)
-
-    @staticmethod
-    def _status_color(status: str) -> QColor:
-        if status == "incorrect":
-            return QColor("#ff3d3d")
-        if status == "correct":
-            return QColor("#ff8a00")
-        return QColor("#9ca3af")
+        return scaled
 
     def cleanup(self):
         """清理资源，释放 pixmap 占用的内存"""
+        if not self._built:
+            return
         try:
             self.preview_label.clear()
             self.preview_label.setPixmap(QPixmap())
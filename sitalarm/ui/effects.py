@@ -1,9 +1,68 @@
 from __future__ import annotations
 
-from PyQt5.QtCore import QObject, QEvent
+import functools
+from typing import Any, Callable, TypeVar
+
+from PyQt5.QtCore import QObject, QEvent, QTimer
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QGraphicsDropShadowEffect, QPushButton, QWidget
 
+_Method = TypeVar("_Method", bound=Callable[..., None])
+
+
+class _ThrottleState:
+    __slots__ = ("timer", "pending")
+
+    def __init__(self, timer: QTimer) -> None:
+        self.timer = timer
+        self.pending: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+
+
+def qthrottled(
+    interval_ms: int,
+    detach: Callable[..., tuple[tuple[Any, ...], dict[str, Any]]] | None = None,
+) -> Callable[[_Method], _Method]:
+    """Let a QObject method run at most once per interval_ms.
+
+    The first call runs immediately; calls made during the interval are collapsed and only
+    the newest one runs when the interval ends. Meant for slots fed faster than a human can
+    see, e.g. camera-rate preview updates.
+
+    A held-back call runs after its caller has moved on, so arguments backed by buffers the
+    caller reuses must be copied: detach(*args, **kwargs) returns the (args, kwargs) to keep.
+    """
+
+    def decorate(method: _Method) -> _Method:
+        state_attr = f"_qthrottle_{method.__name__}"
+
+        def flush(obj: QObject, state: _ThrottleState) -> None:
+            if state.pending is None:
+                return
+            args, kwargs = state.pending
+            state.pending = None
+            method(obj, *args, **kwargs)
+            state.timer.start()
+
+        @functools.wraps(method)
+        def wrapper(self: QObject, *args: Any, **kwargs: Any) -> None:
+            state = getattr(self, state_attr, None)
+            if state is None:
+                timer = QTimer(self)
+                timer.setSingleShot(True)
+                timer.setInterval(interval_ms)
+                state = _ThrottleState(timer)
+                timer.timeout.connect(lambda: flush(self, state))
+                setattr(self, state_attr, state)
+            if state.timer.isActive():
+                state.pending = detach(*args, **kwargs) if detach is not None else (args, kwargs)
+                return
+            method(self, *args, **kwargs)
+            state.timer.start()
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
 
 class _HoverShadowFilter(QObject):
     def __init__(self) -> None:
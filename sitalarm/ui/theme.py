@@ -128,7 +128,7 @@ QLabel#LastEventLabel {
     color: #3d4755;
 }
 
-QTextEdit#DashboardMessageBox {
+QLabel#DashboardMessageBox {
     border: none;
     background: transparent;
     font-size: 16px;